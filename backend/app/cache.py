@@ -0,0 +1,154 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import functools
+import orjson
+from typing import Dict, Optional, Tuple
+from dotenv import load_dotenv
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
+import redis.asyncio as redis
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Redis URL from environment; without it results are cached in-process only
+REDIS_URL = os.getenv("REDIS_URL")
+
+class ResultCache:
+    """TTL cache for API responses and other expensive results, backed by Redis"""
+
+    # Seconds to stop talking to Redis after a connection failure
+    REDIS_RETRY_AFTER = 30
+    # Upper bound on entries kept by the in-process fallback
+    LOCAL_MAX_ENTRIES = 1024
+
+    def __init__(self, redis_url: Optional[str] = None):
+        self._redis = redis.from_url(
+            redis_url, socket_connect_timeout=1, socket_timeout=1
+        ) if redis_url else None
+        self._redis_down_until = 0.0
+        self._local: Dict[str, Tuple[float, bytes]] = {}
+
+    def _redis_available(self) -> bool:
+        return self._redis is not None and time.monotonic() >= self._redis_down_until
+
+    def _redis_failed(self, e: Exception):
+        logger.warning(f"Redis cache unavailable, using in-process cache: {str(e)}")
+        self._redis_down_until = time.monotonic() + self.REDIS_RETRY_AFTER
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return the cached value for key, or None on a miss"""
+        if self._redis_available():
+            try:
+                return await self._redis.get(key)
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._local[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, expire: int):
+        """Store value under key for expire seconds"""
+        if self._redis_available():
+            try:
+                await self._redis.set(key, value, ex=expire)
+                return
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        if len(self._local) >= self.LOCAL_MAX_ENTRIES:
+            now = time.monotonic()
+            self._local = {k: v for k, v in self._local.items() if v[0] >= now}
+            if len(self._local) >= self.LOCAL_MAX_ENTRIES:
+                # Still full: evict the oldest entry
+                self._local.pop(next(iter(self._local)))
+        self._local[key] = (time.monotonic() + expire, value)
+
+    async def acquire(self, key: str, expire: int) -> bool:
+        """Take a lock shared by all processes for expire seconds; False if someone else holds it"""
+        if self._redis_available():
+            try:
+                return bool(await self._redis.set(key, b"1", ex=expire, nx=True))
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        # Without Redis every process has its own cache, so a local lock is enough
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, b"1", expire)
+        return True
+
+    async def release(self, key: str):
+        """Drop a lock taken with acquire before it expires"""
+        if self._redis_available():
+            try:
+                await self._redis.delete(key)
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        self._local.pop(key, None)
+
+    async def clear(self, namespace: str):
+        """Drop every key stored under a namespace"""
+        prefix = f"{namespace}:"
+        if self._redis_available():
+            try:
+                keys = [key async for key in self._redis.scan_iter(match=f"{prefix}*")]
+                if keys:
+                    await self._redis.delete(*keys)
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        for key in [key for key in self._local if key.startswith(prefix)]:
+            del self._local[key]
+
+def cached(namespace: str, expire: int, response_model=None):
+    """
+    Cache an endpoint's response, keyed by a hash of its query parameters
+
+    Hits are returned as ready-made JSON responses, skipping the handler and
+    response-model validation entirely.
+
+    Args:
+        namespace: Key prefix, used to invalidate related entries together
+        expire: Time to live in seconds
+        response_model: Pydantic model used to serialize the response for storage
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            params = {k: v for k, v in kwargs.items() if not isinstance(v, AsyncSession)}
+            digest = hashlib.blake2b(
+                json.dumps(params, sort_keys=True, default=str).encode(), digest_size=16
+            ).hexdigest()
+            key = f"{namespace}:{func.__name__}:{digest}"
+
+            hit = await result_cache.get(key)
+            if hit is not None:
+                return Response(hit, media_type="application/json")
+
+            result = await func(*args, **kwargs)
+            if isinstance(result, Response):
+                body = result.body
+            elif response_model is not None:
+                body = response_model.model_validate(result, from_attributes=True).model_dump_json().encode()
+            else:
+                body = orjson.dumps(jsonable_encoder(result))
+            await result_cache.set(key, body, expire)
+            return result
+        return wrapper
+    return decorator
+
+# Create cache instance
+result_cache = ResultCache(REDIS_URL)
@@ -1,6 +1,5 @@
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 import os
 from dotenv import load_dotenv
 
@@ -9,23 +8,34 @@ load_dotenv()
 # Database URL from environment
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./rmg_news.db")
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    DATABASE_URL,
-    # SQLite specific settings
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+def to_async_url(url: str) -> str:
+    """Point a plain database URL at its asyncio driver (asyncpg / aiosqlite)"""
+    scheme, _, rest = url.partition("://")
+    if scheme in ("postgres", "postgresql"):
+        return f"postgresql+asyncpg://{rest}"
+    if scheme == "sqlite":
+        return f"sqlite+aiosqlite://{rest}"
+    return url
+
+# Create async SQLAlchemy engine
+engine = create_async_engine(
+    to_async_url(DATABASE_URL),
+    # Connection pool settings (SQLite uses its own per-file pool)
+    **({} if "sqlite" in DATABASE_URL else {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,
+    })
 )
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create AsyncSessionLocal class
+AsyncSessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 # Create Base class for models
 Base = declarative_base()
 
 # Dependency to get database session
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close() 
\ No newline at end of file
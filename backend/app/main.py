@@ -1,36 +1,84 @@
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi.responses import JSONResponse
+from sqlalchemy import select, func, tuple_, literal_column, bindparam, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 import os
 import asyncio
+import time
+import functools
+import logging
+import orjson
+from contextlib import asynccontextmanager, suppress
 from dotenv import load_dotenv
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from pydantic import BaseModel
 
 # Import our modules
-from .database import engine, get_db
-from .models import Base, NewsArticle
+from .database import engine, get_db, AsyncSessionLocal
+from .cache import cached, result_cache
+from .models import Base, NewsArticle, SEARCH_DOCUMENT
 from .schemas import (
     MarketInsightsResponse, Topic, NewsResponse, TrendingTopicsResponse,
-    NewsAnalysis
+    NewsAnalysis, NewsArticle as NewsArticleSchema, SourceNewsArticle, SourceNewsResponse
 )
 from .services.agno_service import agno_service
 from .services.rmg_news_service import rmg_news_service
+from .services import trending_numba
 
 # Load environment variables
 load_dotenv()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
+
+# News sources are static configuration, so look them up once
+_SOURCES = rmg_news_service.get_sources()
+_SOURCE_KEYS = frozenset(_SOURCES)
+_SOURCE_KEYS_LIST = list(_SOURCES)
+
+# Trending topics for the default window are recomputed in the background
+TRENDING_HOURS_BACK = 24
+TRENDING_REFRESH_INTERVAL = 600
+TRENDING_CACHE_KEY = f"trending:latest:{TRENDING_HOURS_BACK}"
+# Held by whichever worker refreshes trending topics this interval; it lives in
+# the trending namespace so clearing that after a fetch lets the next request refresh
+TRENDING_REFRESH_LOCK = "trending:refresh-lock"
+# How long a request waits for another worker's refresh before computing its own
+TRENDING_WAIT_SECONDS = 10
+TRENDING_WAIT_POLL = 0.25
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks"""
+    # Schema is managed by Alembic (`alembic upgrade head`); create_all is opt-in
+    # for throwaway local databases
+    if os.getenv("AUTO_CREATE_TABLES") == "1":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    trending_task = asyncio.create_task(refresh_trending_periodically())
+    yield
+    trending_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await trending_task
+    await agno_service.aclose()
+    await engine.dispose()
 
 # Create FastAPI instance
 app = FastAPI(
     title="RMG News AI Agent API",
     description="A sophisticated AI-powered news aggregation and analysis platform for the Ready-Made Garment industry",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder"""
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -56,9 +104,101 @@ def create_paginated_response(articles: List, total: int, page: int, per_page: i
         "has_next": has_next,
         "has_prev": has_prev,
         "next_page": page + 1 if has_next else None,
-        "prev_page": page - 1 if has_prev else None
+        "prev_page": page - 1 if has_prev else None,
+        "next_cursor": encode_cursor(articles[-1]) if len(articles) == per_page else None
     }
 
+# Article fields shared by the ORM model and a response schema
+@functools.cache
+def _article_fields(schema) -> List[str]:
+    return [field for field in schema.model_fields if field in NewsArticle.__table__.columns]
+
+_ARTICLE_FIELDS = _article_fields(NewsArticleSchema)
+_SOURCE_ARTICLE_FIELDS = _article_fields(SourceNewsArticle)
+# Listing queries load only those columns; relations added later should be
+# appended as selectinload() options here to keep listings at one extra query
+_LIST_LOAD_OPTIONS = (load_only(*(getattr(NewsArticle, field) for field in _ARTICLE_FIELDS)),)
+_SOURCE_LIST_LOAD_OPTIONS = (load_only(*(getattr(NewsArticle, field) for field in _SOURCE_ARTICLE_FIELDS)),)
+
+def paginated_json_response(
+    articles: List[NewsArticle], total: int, page: int, per_page: int,
+    article_schema=NewsArticleSchema, response_schema=NewsResponse
+) -> Response:
+    """Serialize a page of articles as response_schema JSON without re-validating every row"""
+    fields = _article_fields(article_schema)
+    payload = create_paginated_response(
+        [
+            article_schema.model_construct(**{field: getattr(article, field) for field in fields})
+            for article in articles
+        ],
+        total, page, per_page
+    )
+    response = response_schema.model_construct(**{field: payload[field] for field in response_schema.model_fields})
+    # Rows come straight from the database, so skip the type-mismatch warnings
+    # for values pydantic would otherwise coerce (e.g. url str -> HttpUrl)
+    return Response(response.model_dump_json(warnings=False), media_type="application/json")
+
+def encode_cursor(article: NewsArticle) -> str:
+    """Encode an article's (published_at, id) sort key as a keyset cursor"""
+    return f"{article.published_at.isoformat()},{article.id}"
+
+def decode_cursor(cursor: str) -> tuple:
+    """Decode a keyset cursor produced by encode_cursor"""
+    try:
+        published_at, article_id = cursor.rsplit(",", 1)
+        return datetime.fromisoformat(published_at), int(article_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor '{cursor}'")
+
+# Search filters are built once; the search term is bound per request
+_FULL_TEXT_MATCH = literal_column(SEARCH_DOCUMENT).op("@@")(
+    func.plainto_tsquery("english", bindparam("search_query"))
+)
+_SUBSTRING_MATCH = NewsArticle.search_text.ilike(bindparam("search_pattern"))
+
+async def count_rows(count_stmt: Select, params: Optional[dict] = None) -> int:
+    """Run a count on its own session so it can overlap a query on the request session"""
+    async with AsyncSessionLocal() as db:
+        return await db.scalar(count_stmt, params)
+
+async def fetch_page(db: AsyncSession, stmt: Select, page: int, per_page: int, cursor: Optional[str] = None,
+                     params: Optional[dict] = None) -> tuple:
+    """Fetch one page of articles, newest first, together with the total match count.
+
+    Offset pages carry the total as a COUNT(*) OVER () window column, so rows and
+    count come back in a single query. With a cursor the page is seeked on
+    (published_at, id) instead, which stays cheap however deep the client pages;
+    the total then needs its own count, which runs concurrently with the page.
+    """
+    ordered = stmt.order_by(NewsArticle.published_at.desc(), NewsArticle.id.desc())
+    count_stmt = select(func.count()).select_from(stmt.subquery())
+    
+    if cursor:
+        published_at, article_id = decode_cursor(cursor)
+        result, total = await asyncio.gather(
+            db.execute(
+                ordered.where(
+                    tuple_(NewsArticle.published_at, NewsArticle.id) < tuple_(published_at, article_id)
+                ).limit(per_page),
+                params
+            ),
+            count_rows(count_stmt, params)
+        )
+        return result.scalars().all(), total
+    
+    result = await db.execute(
+        ordered.add_columns(func.count().over().label("_total"))
+               .offset((page - 1) * per_page)
+               .limit(per_page),
+        params
+    )
+    rows = result.all()
+    if rows:
+        return [row[0] for row in rows], rows[0]._total
+    
+    # Past the last page there is no row to read the window total from
+    return [], await db.scalar(count_stmt, params) if page > 1 else 0
+
 @app.get("/")
 async def root():
     """Root endpoint - API health check"""
@@ -84,12 +224,14 @@ async def health_check():
     }
 
 @app.get("/api/news", response_model=NewsResponse)
+@cached(namespace="news", expire=60, response_model=NewsResponse)
 async def get_news(
     page: int = 1,
     per_page: int = 10,
     query: Optional[str] = None,
     source: Optional[str] = None,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
 ):
     """Get RMG news articles from database with pagination"""
     try:
@@ -100,41 +242,42 @@ async def get_news(
             per_page = 10
         
         # Build query
-        query_builder = db.query(NewsArticle)
+        stmt = select(NewsArticle).options(*_LIST_LOAD_OPTIONS)
         
         # Filter by source if specified
         if source:
-            query_builder = query_builder.filter(NewsArticle.source == source)
+            stmt = stmt.where(NewsArticle.source == source)
         
         # Filter by search query if specified
+        params = None
         if query:
-            query_builder = query_builder.filter(
-                NewsArticle.title.contains(query) | 
-                NewsArticle.content.contains(query) |
-                NewsArticle.summary.contains(query)
-            )
-        
-        # Get total count
-        total = query_builder.count()
+            if db.bind.dialect.name == "postgresql":
+                # Full-text match served by the ix_news_search GIN index
+                stmt = stmt.where(_FULL_TEXT_MATCH)
+                params = {"search_query": query}
+            else:
+                stmt = stmt.where(_SUBSTRING_MATCH)
+                params = {"search_pattern": f"%{query}%"}
         
-        # Apply pagination
-        articles = query_builder.order_by(NewsArticle.published_at.desc()) \
-                               .offset((page - 1) * per_page) \
-                               .limit(per_page) \
-                               .all()
+        # Fetch the page and total count in one go
+        articles, total = await fetch_page(db, stmt, page, per_page, cursor, params)
         
-        return create_paginated_response(articles, total, page, per_page)
+        return paginated_json_response(articles, total, page, per_page)
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch news: {str(e)}")
 
 @app.get("/api/headlines", response_model=NewsResponse)
+@cached(namespace="news", expire=60, response_model=NewsResponse)
 async def get_headlines(
     category: str = "business",
     country: str = "us",
     page: int = 1,
     per_page: int = 10,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
 ):
     """Get top business headlines from database with pagination"""
     try:
@@ -145,26 +288,22 @@ async def get_headlines(
             per_page = 10
         
         # Query articles from database
-        query_builder = db.query(NewsArticle)
+        stmt = select(NewsArticle).options(*_LIST_LOAD_OPTIONS)
         
         # Filter by category if specified
         if category and category != "business":
             if category.lower() in ["rmg", "textile", "garment"]:
-                query_builder = query_builder.filter(
-                    NewsArticle.source.in_(list(rmg_news_service.get_sources().keys()))
+                stmt = stmt.where(
+                    NewsArticle.source.in_(_SOURCE_KEYS_LIST)
                 )
         
-        # Get total count
-        total = query_builder.count()
+        # Fetch the page and total count in one go
+        headlines, total = await fetch_page(db, stmt, page, per_page, cursor)
         
-        # Apply pagination
-        headlines = query_builder.order_by(NewsArticle.published_at.desc()) \
-                                .offset((page - 1) * per_page) \
-                                .limit(per_page) \
-                                .all()
-        
-        return create_paginated_response(headlines, total, page, per_page)
+        return paginated_json_response(headlines, total, page, per_page)
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch headlines: {str(e)}")
 
@@ -176,7 +315,7 @@ class AnalyzeRequest(BaseModel):
 @app.post("/api/analyze", response_model=NewsAnalysis)
 async def analyze_article(
     request: AnalyzeRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Analyze a news article using AI"""
     try:
@@ -200,10 +339,10 @@ async def analyze_article(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to analyze article: {str(e)}")
 
-@app.get("/api/sentiment")
+@app.get("/api/sentiment", response_class=ORJSONResponse)
 async def get_sentiment_analysis(
     text: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get sentiment analysis for text"""
     try:
@@ -218,71 +357,141 @@ async def get_sentiment_analysis(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to analyze sentiment: {str(e)}")
 
+async def compute_trending_topics(db: AsyncSession, hours_back: int) -> TrendingTopicsResponse:
+    """Rank the topics trending in articles published within the last hours_back hours"""
+    now = datetime.now(timezone.utc)
+    
+    # Get recent articles from database for trending analysis
+    from datetime import timedelta
+    cutoff_time = datetime.now() - timedelta(hours=hours_back)
+    
+    result = await db.execute(
+        select(NewsArticle.title, NewsArticle.content).where(
+            NewsArticle.published_at >= cutoff_time
+        ).order_by(NewsArticle.published_at.desc()).limit(20)
+    )
+    
+    # Prepare article texts for analysis
+    article_texts = [f"{title} {content}" for title, content in result if content and title]
+    
+    trending_data = []
+    if trending_numba.SCORER_AVAILABLE and article_texts:
+        # Score terms locally against the preceding window of the same length
+        result = await db.execute(
+            select(NewsArticle.title, NewsArticle.content).where(
+                NewsArticle.published_at < cutoff_time,
+                NewsArticle.published_at >= cutoff_time - timedelta(hours=hours_back)
+            ).order_by(NewsArticle.published_at.desc()).limit(100)
+        )
+        baseline_texts = [f"{title} {content}" for title, content in result if content]
+        # Tokenizing and the first-call JIT compile are CPU-bound; keep them off the event loop
+        trending_data = await asyncio.to_thread(trending_numba.rank_trending_terms, article_texts, baseline_texts)
+    
+    if not trending_data:
+        trending_data = await agno_service.identify_trending_topics(article_texts)
+    
+    # Convert to Topic objects
+    topics = [
+        Topic(
+            id=i,
+            name=topic_data.get("name", ""),
+            category=topic_data.get("category", "General"),
+            is_trending=True,
+            trend_score=topic_data.get("score", 0),
+            created_at=now
+        )
+        for i, topic_data in enumerate(trending_data, start=1)
+    ]
+    
+    return TrendingTopicsResponse(
+        topics=topics,
+        updated_at=now
+    )
+
+async def refresh_trending() -> bytes:
+    """Recompute trending topics for the default window and store them in the cache"""
+    async with AsyncSessionLocal() as db:
+        trending = await compute_trending_topics(db, TRENDING_HOURS_BACK)
+    body = trending.model_dump_json().encode()
+    # Outlive the refresh interval so a slow refresh never leaves a gap
+    await result_cache.set(TRENDING_CACHE_KEY, body, TRENDING_REFRESH_INTERVAL + 300)
+    return body
+
+async def get_cached_trending() -> Optional[bytes]:
+    """Return trending topics for the default window, refreshing them in one worker at a time on a miss"""
+    hit = await result_cache.get(TRENDING_CACHE_KEY)
+    if hit is not None:
+        return hit
+    
+    if await result_cache.acquire(TRENDING_REFRESH_LOCK, TRENDING_REFRESH_INTERVAL):
+        try:
+            return await refresh_trending()
+        except Exception:
+            # Let the next request retry instead of waiting out the lock
+            await result_cache.release(TRENDING_REFRESH_LOCK)
+            raise
+    
+    # Another worker is refreshing; wait for its result
+    deadline = time.monotonic() + TRENDING_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        await asyncio.sleep(TRENDING_WAIT_POLL)
+        hit = await result_cache.get(TRENDING_CACHE_KEY)
+        if hit is not None:
+            return hit
+    return None
+
+async def refresh_trending_periodically():
+    while True:
+        try:
+            # Every worker runs this loop; only the one holding the lock refreshes
+            if await result_cache.acquire(TRENDING_REFRESH_LOCK, TRENDING_REFRESH_INTERVAL):
+                await refresh_trending()
+        except Exception as e:
+            logger.error(f"Error refreshing trending topics: {str(e)}")
+        await asyncio.sleep(TRENDING_REFRESH_INTERVAL)
+
 @app.get("/api/trending", response_model=TrendingTopicsResponse)
 async def get_trending_topics(
-    hours_back: int = 24,
-    db: Session = Depends(get_db)
+    hours_back: int = TRENDING_HOURS_BACK,
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get trending topics in RMG industry from database"""
+    """Get trending topics in RMG industry, precomputed for the default window"""
     try:
-        # Get recent articles from database for trending analysis
-        from datetime import timedelta
-        cutoff_time = datetime.now() - timedelta(hours=hours_back)
-        
-        articles = db.query(NewsArticle).filter(
-            NewsArticle.published_at >= cutoff_time
-        ).order_by(NewsArticle.published_at.desc()).limit(20).all()
-        
-        # Prepare article texts for analysis
-        article_texts = []
-        for article in articles:
-            if article.content and article.title:
-                article_texts.append(f"{article.title} {article.content}")
+        if hours_back == TRENDING_HOURS_BACK:
+            hit = await get_cached_trending()
+            if hit is not None:
+                return Response(hit, media_type="application/json")
         
-        trending_data = await agno_service.identify_trending_topics(article_texts[:10])
-        
-        # Convert to Topic objects
-        topics = []
-        for topic_data in trending_data:
-            topic = Topic(
-                id=len(topics) + 1,
-                name=topic_data.get("name", ""),
-                category=topic_data.get("category", "General"),
-                is_trending=True,
-                trend_score=topic_data.get("score", 0),
-                created_at=datetime.now()
-            )
-            topics.append(topic)
-        
-        return TrendingTopicsResponse(
-            topics=topics,
-            updated_at=datetime.now()
-        )
+        return await compute_trending_topics(db, hours_back)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get trending topics: {str(e)}")
 
-@app.get("/api/sources")
+@app.get("/api/sources", response_class=ORJSONResponse)
+@cached(namespace="sources", expire=3600)
 async def get_sources():
     """Get available news sources"""
     try:
-        sources = rmg_news_service.get_sources()
         return {
-            "sources": sources,
-            "total": len(sources)
+            "sources": _SOURCES,
+            "total": len(_SOURCES)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get sources: {str(e)}")
 
-@app.post("/api/fetch-news")
+@app.post("/api/fetch-news", response_class=ORJSONResponse)
 async def fetch_news_from_sources(
     articles_per_source: int = 15,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Fetch news from all sources and store in database"""
     try:
         results = await rmg_news_service.fetch_all_sources(db, articles_per_source)
         
+        # Drop cached listings and trending results so new articles show up immediately
+        await result_cache.clear("news")
+        await result_cache.clear("trending")
+        
         return {
             "message": "News fetching completed",
             "results": results,
@@ -293,12 +502,14 @@ async def fetch_news_from_sources(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch news: {str(e)}")
 
-@app.get("/api/news/sources/{source_id}")
+@app.get("/api/news/sources/{source_id}", response_model=SourceNewsResponse)
+@cached(namespace="news", expire=60, response_model=SourceNewsResponse)
 async def get_news_by_source(
     source_id: str,
     page: int = 1,
     per_page: int = 10,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
 ):
     """Get news articles from a specific source with pagination"""
     try:
@@ -309,21 +520,19 @@ async def get_news_by_source(
             per_page = 10
         
         # Validate source
-        sources = rmg_news_service.get_sources()
-        if source_id not in sources:
+        if source_id not in _SOURCE_KEYS:
             raise HTTPException(status_code=404, detail=f"Source '{source_id}' not found")
         
         # Query articles from specific source
-        query_builder = db.query(NewsArticle).filter(NewsArticle.source == source_id)
-        total = query_builder.count()
+        stmt = select(NewsArticle).options(*_SOURCE_LIST_LOAD_OPTIONS).where(NewsArticle.source == source_id)
         
-        # Apply pagination
-        articles = query_builder.order_by(NewsArticle.published_at.desc()) \
-                               .offset((page - 1) * per_page) \
-                               .limit(per_page) \
-                               .all()
+        # Fetch the page and total count in one go
+        articles, total = await fetch_page(db, stmt, page, per_page, cursor)
         
-        return create_paginated_response(articles, total, page, per_page)
+        return paginated_json_response(
+            articles, total, page, per_page,
+            article_schema=SourceNewsArticle, response_schema=SourceNewsResponse
+        )
         
     except HTTPException:
         raise
@@ -331,65 +540,51 @@ async def get_news_by_source(
         raise HTTPException(status_code=500, detail=f"Failed to fetch news from source: {str(e)}")
 
 @app.get("/api/insights", response_model=MarketInsightsResponse)
-async def get_market_insights(db: Session = Depends(get_db)):
+@cached(namespace="trending", expire=600, response_model=MarketInsightsResponse)
+async def get_market_insights(db: AsyncSession = Depends(get_db)):
     """Get comprehensive market insights dashboard data"""
+    now = datetime.now(timezone.utc)
     try:
         # Get articles from database
-        articles = db.query(NewsArticle).order_by(NewsArticle.published_at.desc()).limit(20).all()
+        result = await db.execute(
+            select(NewsArticle.title, NewsArticle.content).order_by(NewsArticle.published_at.desc()).limit(20)
+        )
+        articles = result.all()
         
         # Get trending topics from recent articles
-        article_texts = [f"{article.title} {article.content}" for article in articles if article.content]
-        trending_data = await agno_service.identify_trending_topics(article_texts[:10])
+        article_texts = [f"{title} {content}" for title, content in articles if content]
+        trending_data = await agno_service.identify_trending_topics(article_texts)
         
         # Convert trending data to Topic objects
-        topics = []
-        for topic_data in trending_data:
-            topic = Topic(
-                id=len(topics) + 1,
+        topics = [
+            Topic(
+                id=i,
                 name=topic_data.get("name", ""),
                 category=topic_data.get("category", "General"),
                 is_trending=True,
                 trend_score=topic_data.get("score", 0),
-                created_at=datetime.now()
+                created_at=now
             )
-            topics.append(topic)
+            for i, topic_data in enumerate(trending_data, start=1)
+        ]
         
-        # Calculate sentiment overview from database articles
+        # Calculate sentiment overview from the labels stored at ingestion
         sentiment_overview = {}
         if articles:
-            # Analyze a sample of articles for sentiment in parallel
-            sample_articles = articles[:5]
-            
-            # Create analysis tasks
-            analysis_tasks = []
-            for article in sample_articles:
-                task = agno_service.analyze_article(
-                    article.content or '', 
-                    article.title
-                )
-                analysis_tasks.append(task)
-            
-            # Run all analyses in parallel
-            analyses = await asyncio.gather(*analysis_tasks, return_exceptions=True)
-            
-            positive_count = 0
-            negative_count = 0
-            neutral_count = 0
+            recent = select(NewsArticle.sentiment_label) \
+                .order_by(NewsArticle.published_at.desc()) \
+                .limit(len(articles)) \
+                .subquery()
+            result = await db.execute(
+                select(recent.c.sentiment_label, func.count()).group_by(recent.c.sentiment_label)
+            )
+            counts = dict(result.all())
             
-            for analysis in analyses:
-                if isinstance(analysis, Exception):
-                    neutral_count += 1  # Default to neutral on error
-                    continue
-                    
-                sentiment = analysis.get('sentiment', {}).get('label', 'neutral')
-                if sentiment == 'positive':
-                    positive_count += 1
-                elif sentiment == 'negative':
-                    negative_count += 1
-                else:
-                    neutral_count += 1
+            positive_count = counts.get('positive', 0)
+            negative_count = counts.get('negative', 0)
+            neutral_count = len(articles) - positive_count - negative_count  # Unlabelled count as neutral
             
-            total = len(sample_articles)
+            total = len(articles)
             sentiment_overview = {
                 "positive": f"{positive_count}/{total}",
                 "negative": f"{negative_count}/{total}",
@@ -401,7 +596,7 @@ async def get_market_insights(db: Session = Depends(get_db)):
             trending_topics=topics,
             market_trends=[],  # Will be populated when we have trend data
             total_articles=len(articles),
-            last_updated=datetime.now()
+            last_updated=now
         )
         
     except Exception as e:
@@ -409,4 +604,14 @@ async def get_market_insights(db: Session = Depends(get_db)):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # Development entry point; with DEBUG off, run one worker per core on
+    # uvloop/httptools (picked automatically when uvicorn[standard] is installed)
+    debug = os.getenv("DEBUG", "False").lower() == "true"
+    uvicorn.run(
+        "app.main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        reload=debug,
+        workers=1 if debug else os.cpu_count(),
+        backlog=2048,
+    ) 
\ No newline at end of file
@@ -1,18 +1,30 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, Index, text
+from sqlalchemy.orm import column_property
 from sqlalchemy.sql import func
 from .database import Base
 
+# Full-text search document for PostgreSQL; queries must use this exact
+# expression for the planner to pick the GIN index below
+SEARCH_DOCUMENT = "to_tsvector('english', title || ' ' || coalesce(content, '') || ' ' || coalesce(summary, ''))"
+
 class NewsArticle(Base):
     """News article model"""
     __tablename__ = "news_articles"
+    __table_args__ = (
+        # Serves per-source listings ordered newest first
+        Index("ix_news_source_pub", "source", text("published_at DESC"), "id"),
+        # Serves the unfiltered newest-first listings
+        Index("ix_news_published_at", text("published_at DESC")),
+        Index("ix_news_search", text(SEARCH_DOCUMENT), postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String(500), nullable=False)
     content = Column(Text, nullable=True)
     summary = Column(Text, nullable=True)
     url = Column(String(1000), unique=True, nullable=False)
     source = Column(String(200), nullable=False)  # Source name (e.g., "textiletoday", "tbsnews")
-    source_url = Column(String(200), nullable=False)  # Full source URL
+    source_url = Column(String(255), nullable=False)  # Full source URL
     author = Column(String(200), nullable=True)
     published_at = Column(DateTime, nullable=False)
     created_at = Column(DateTime, default=func.now())
@@ -22,4 +34,13 @@ class NewsArticle(Base):
     ai_summary = Column(Text, nullable=True)  # AI-generated summary
     market_impact = Column(String(50), nullable=True)  # high, medium, low
     confidence_score = Column(Float, nullable=True)  # AI confidence (0-1)
-    is_processed = Column(Boolean, default=False)  # Whether AI analysis is done 
\ No newline at end of file
+    sentiment_label = Column(String(16), nullable=True, index=True)  # positive, negative, neutral
+    sentiment_attempts = Column(Integer, nullable=False, default=0, server_default="0")  # Deepseek labelling attempts
+    is_processed = Column(Boolean, default=False)  # Whether AI analysis is done 
+    
+    # Searchable text as one SQL expression, so substring search is a single
+    # predicate; computed on the fly rather than stored to avoid a second copy of content
+    search_text = column_property(
+        title + " " + func.coalesce(content, "") + " " + func.coalesce(summary, ""),
+        deferred=True
+    )
\ No newline at end of file
@@ -112,6 +112,22 @@ class NewsResponse(BaseModel):
     total: int
     page: int = 1
     per_page: int = 10
+    next_cursor: Optional[str] = None
+
+class SourceNewsArticle(NewsArticle):
+    """Article as listed per source, with its source URL and AI analysis fields"""
+    source_url: str
+    ai_summary: Optional[str] = None
+    market_impact: Optional[str] = None
+    confidence_score: Optional[float] = None
+
+class SourceNewsResponse(NewsResponse):
+    articles: List[SourceNewsArticle]
+    total_pages: int
+    has_next: bool
+    has_prev: bool
+    next_page: Optional[int] = None
+    prev_page: Optional[int] = None
 
 class AnalysisResponse(BaseModel):
     success: bool
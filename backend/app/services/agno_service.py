@@ -1,17 +1,410 @@
+from __future__ import annotations
+
 import os
-import requests
-from typing import Dict, Optional, List
+import asyncio
+import httpx
+from typing import TYPE_CHECKING, Dict, Optional, List, Tuple
 from datetime import datetime
-import json
+import hashlib
+import uuid
+import random
+import time
 import logging
-from bs4 import BeautifulSoup
+import orjson
+from collections import OrderedDict, defaultdict
 import re
+import ahocorasick
+from aiolimiter import AsyncLimiter
+from lxml import etree
 from urllib.parse import urljoin, urlparse
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..models import NewsArticle
+from ..cache import result_cache
+
+# bs4 and lxml.html are only needed once scraping starts; imported there to keep startup light
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
 
 logger = logging.getLogger(__name__)
 
+# Seconds a Deepseek analysis is reused for identical article text
+ANALYSIS_CACHE_TTL = 7 * 24 * 3600
+# Analyses also kept in process, in front of the shared cache
+ANALYSIS_LRU_SIZE = 512
+
+# Batched analysis: articles per Deepseek request, a rough prompt budget
+# (~4 characters per token) and how many batch requests run at once
+BATCH_MAX_ARTICLES = 5
+BATCH_CHAR_BUDGET = 16000
+BATCH_CONCURRENCY = 4
+# Approximate tokens of article text sent when identifying trending topics
+TRENDING_TOKEN_BUDGET = 3500
+
+# Deepseek request budget, and retries for rate-limited or failed requests
+DEEPSEEK_REQUESTS_PER_MINUTE = int(os.getenv("DEEPSEEK_REQUESTS_PER_MINUTE", "60"))
+DEEPSEEK_MAX_RETRIES = 3
+DEEPSEEK_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+# Longest wait between retries, in seconds, even if Retry-After asks for more
+DEEPSEEK_MAX_RETRY_DELAY = 30
+
+# Article pages fetched at once per scraped site
+SCRAPE_CONCURRENCY = 15
+# Minimum seconds between requests to the same scraped host
+DOMAIN_REQUEST_INTERVAL = 0.2
+# Deepseek content-cleaning requests in flight at once, across all sites
+CLEAN_CONCURRENCY = 8
+# Bytes of (decompressed) HTML read from a page; the rest is dropped
+MAX_PAGE_BYTES = 2_000_000
+
+# Request headers for listing pages and for article pages
+LISTING_PAGE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'max-age=0'
+}
+ARTICLE_PAGE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Analysis prompts put the fixed instructions and schema first and the articles
+# last, so Deepseek's prompt-prefix cache covers everything but the articles
+_ANALYSIS_SCHEMA = """{
+    "sentiment": {
+        "label": "positive/negative/neutral",
+        "score": -1.0 to 1.0,
+        "confidence": 0.0 to 1.0
+    },
+    "key_insights": "2-3 key insights about the article",
+    "market_impact": "high/medium/low",
+    "topics": ["topic1", "topic2", "topic3"],
+    "geographic_impact": "regions affected",
+    "industry_sectors": ["sector1", "sector2"],
+    "business_implications": "what this means for businesses"
+}"""
+
+_ANALYZE_SYSTEM_PROMPT = "You are an expert analyst specializing in the Ready-Made Garment (RMG) industry. Provide accurate, insightful analysis of news articles with focus on market impact, trends, and business implications. Always respond with valid JSON format."
+
+_ANALYZE_PROMPT_PREFIX = f"""Analyze the RMG (Ready-Made Garment) industry news article below and provide detailed insights.
+Focus on the RMG industry context and provide actionable insights.
+
+Please provide analysis in the following JSON format:
+{_ANALYSIS_SCHEMA}"""
+
+_BATCH_SYSTEM_PROMPT = "You are an expert analyst specializing in the Ready-Made Garment (RMG) industry. Analyze each news article independently and return one result per article. Always respond with valid JSON format."
+
+_BATCH_PROMPT_PREFIX = f"""Analyze each of the RMG (Ready-Made Garment) industry news articles below.
+
+Return a JSON object {{"analyses": [...]}} whose array has exactly one object per article, in the same order, each in this format:
+{_ANALYSIS_SCHEMA}"""
+
+_CLEAN_SYSTEM_PROMPT = "You are an expert content editor specializing in RMG industry news. Clean article content only, no summaries."
+
+_CLEAN_PROMPT_PREFIX = """Please clean the RMG industry news article content below.
+
+Please return ONLY the cleaned article content (no JSON, no title, no metadata) in this exact JSON format:
+{
+    "cleaned_content": "Pure article content with proper formatting, no title or metadata"
+}
+
+Important:
+- Return ONLY the article content in cleaned_content (no title, no JSON wrapper, no metadata)
+- Make the content readable and well-formatted
+- Remove any HTML artifacts or formatting issues
+- Keep all important information and details
+- Do NOT generate any summary, just clean the content"""
+
+# Characters of raw article content sent for cleaning, to stay within token limits
+CLEAN_CONTENT_CHARS = 3000
+
+def _compile_patterns(patterns) -> re.Pattern:
+    """Compile literal patterns into one alternation, longest first so overlapping patterns match whole"""
+    return re.compile("|".join(re.escape(p) for p in sorted(set(patterns), key=len, reverse=True)))
+
+def _build_automaton(buckets: Dict[str, Tuple[str, ...]]) -> ahocorasick.Automaton:
+    """Build one Aho-Corasick automaton over several pattern lists, tagging each pattern with the buckets it belongs to"""
+    tags: Dict[str, set] = {}
+    for bucket, patterns in buckets.items():
+        for pattern in patterns:
+            tags.setdefault(pattern, set()).add(bucket)
+    automaton = ahocorasick.Automaton()
+    for pattern, pattern_buckets in tags.items():
+        automaton.add_word(pattern, (frozenset(pattern_buckets), pattern))
+    automaton.make_automaton()
+    return automaton
+
+def _match_buckets(automaton: ahocorasick.Automaton, text: str) -> Dict[str, str]:
+    """Map each bucket matched anywhere in text to the first of its patterns found"""
+    matches: Dict[str, str] = {}
+    for _, (buckets, pattern) in automaton.iter(text):
+        for bucket in buckets:
+            matches.setdefault(bucket, pattern)
+    return matches
+
+def _match_patterns(automaton: ahocorasick.Automaton, text: str) -> Dict[str, set]:
+    """Map each bucket matched anywhere in text to every distinct pattern of it found, overlapping ones included"""
+    matches: Dict[str, set] = {}
+    for _, (buckets, pattern) in automaton.iter(text):
+        for bucket in buckets:
+            matches.setdefault(bucket, set()).add(pattern)
+    return matches
+
+# Keyword lists, matched as substrings of lowercased text
+
+POSITIVE_KEYWORDS = ("growth", "increase", "profit", "expansion", "success", "boost", "rise")
+NEGATIVE_KEYWORDS = ("decline", "loss", "crisis", "drop", "fall", "recession", "problem")
+
+# Sentiment cues in a Deepseek reply that was not valid JSON
+TEXT_POSITIVE_CUES = ("positive", "growth", "increase", "success")
+TEXT_NEGATIVE_CUES = ("negative", "decline", "crisis", "problem")
+
+TOPIC_KEYWORDS = (
+    "garment", "textile", "fashion", "apparel", "clothing",
+    "manufacturing", "export", "cotton", "fabric", "factory"
+)
+
+RMG_KEYWORDS = (
+    'rmg', 'textile', 'garment', 'apparel', 'clothing', 'fashion',
+    'manufacturing', 'export', 'cotton', 'fabric', 'factory',
+    'bangladesh', 'bgmea', 'bkmea', 'trade', 'industry'
+)
+
+# Titles containing these are never news links
+NON_NEWS_TITLE_PATTERNS = (
+    # Navigation and UI elements
+    'home', 'about', 'contact', 'login', 'register', 'sign up', 'sign in',
+    'search', 'menu', 'navigation', 'footer', 'header', 'sidebar',
+    'read more', 'read original article', 'click here', 'learn more',
+    'subscribe', 'newsletter', 'advertisement', 'advertise',
+    
+    # Social media and external links
+    'facebook', 'twitter', 'linkedin', 'youtube', 'instagram', 'whatsapp',
+    'telegram', 'tiktok', 'snapchat', 'pinterest',
+    
+    # Contact and company info
+    'house-', 'road-', 'floor', 'dhaka', 'bangladesh',
+    'info@', '@', 'phone', 'tel:', 'fax:', 'email:',
+    'copyright', '©', 'all rights reserved', 'privacy',
+    'terms', 'contact us', 'about us', 'careers', 'jobs',
+    
+    # Generic actions
+    'download', 'upload', 'share', 'print', 'bookmark', 'favorite',
+    'like', 'comment', 'reply', 'follow', 'unfollow',
+    
+    # File types and media
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.jpg', '.jpeg', '.png', '.gif', '.mp4', '.mp3', '.avi',
+    
+    # Common website elements
+    'cookie', 'policy', 'disclaimer', 'sitemap', 'rss', 'feed',
+    'archive', 'category', 'tag', 'author', 'date', 'time'
+)
+
+# URLs containing these are never news links
+NON_NEWS_URL_PATTERNS = (
+    '/login', '/register', '/signup', '/signin', '/account',
+    '/cart', '/checkout', '/payment', '/billing',
+    '/admin', '/dashboard', '/panel', '/control',
+    '/api/', '/ajax/', '/json/', '/xml/',
+    '/assets/', '/css/', '/js/', '/images/', '/uploads/',
+    '/download/', '/upload/', '/media/',
+    '/search', '/filter', '/sort', '/page/',
+    '/tag/', '/category/', '/author/', '/date/',
+    '/rss', '/feed', '/sitemap', '/robots.txt'
+)
+
+# Title words suggesting a news link
+NEWS_TITLE_PATTERNS = (
+    # Action words
+    'announces', 'launches', 'reports', 'reveals', 'introduces',
+    'celebrates', 'partners', 'expands', 'invests', 'acquires',
+    'appoints', 'awards', 'recognizes', 'develops', 'innovates',
+    'challenges', 'opportunities', 'growth', 'development',
+    'releases', 'unveils', 'discloses', 'confirms',
+    'denies', 'responds', 'comments', 'states', 'declares',
+    
+    # Industry and business terms
+    'industry', 'market', 'trade', 'export', 'import',
+    'technology', 'innovation', 'sustainability', 'compliance',
+    'manufacturing', 'production', 'supply chain', 'logistics',
+    'investment', 'funding', 'financing', 'revenue', 'profit',
+    'partnership', 'collaboration', 'agreement', 'contract',
+    
+    # Time-based indicators
+    'today', 'yesterday', 'this week', 'this month', 'this year',
+    'latest', 'recent', 'new', 'updated', 'breaking',
+    
+    # Event indicators
+    'event', 'conference', 'summit', 'meeting', 'workshop',
+    'exhibition', 'fair', 'show', 'presentation', 'seminar'
+)
+
+# URL fragments that identify article pages
+NEWS_URL_STRUCTURE = (
+    '/article/', '/news/', '/story/', '/post/', '/blog/',
+    '/202', '/2024', '/2025',  # Year indicators
+    '/jan/', '/feb/', '/mar/', '/apr/', '/may/', '/jun/',
+    '/jul/', '/aug/', '/sep/', '/oct/', '/nov/', '/dec/'
+)
+
+# Listing-page elements that hold article links, matched in a single pass
+ARTICLE_LINK_SELECTORS = (
+    # Generic article patterns
+    'a[href*="/article/"]',
+    'a[href*="/news/"]',
+    'a[href*="/story/"]',
+    'a[href*="/post/"]',
+    'a[href*="/page/"]',
+    'a[href*="/category/"]',
+    
+    # Common article containers
+    'article a',
+    '.article a',
+    '.news-item a',
+    '.post a',
+    '.news a',
+    '.content a',
+    '.main-content a',
+    
+    # Headers with links
+    'h1 a',
+    'h2 a',
+    'h3 a',
+    'h4 a',
+    '.entry-title a',
+    '.post-title a',
+    '.article-title a',
+    '.headline a',
+    '.title a',
+    
+    # Specific to BGMEA and Financial Express
+    '.news-list a',
+    '.news-container a',
+    '.news-block a',
+    '.news-section a',
+    '.all-news a',
+    '.special-issues a',
+    '.rmg-textile a',
+    
+    # Textile Today specific (based on image analysis)
+    '.category a',
+    '.news-analysis a',
+    '.textile-apparel a',
+    '.content-area a',
+    '.article-list a',
+    '.news-grid a',
+    '.post-grid a',
+    
+    # WordPress specific (common for news sites)
+    '.entry a',
+    '.blog-post a',
+    '.news-post a'
+)
+ARTICLE_LINK_SELECTOR = ", ".join(ARTICLE_LINK_SELECTORS)
+
+# Link-level filters applied while collecting links from a listing page
+LINK_NAVIGATION_WORDS = ('login', 'register', 'search')
+LINK_STATIC_PATTERNS = (
+    'house-', 'road-', 'floor', 'dhaka', 'bangladesh',
+    'info@', '@', 'phone', 'tel:', 'fax:', 'email:',
+    'copyright', '©', 'all rights reserved', 'privacy',
+    'terms', 'contact us', 'about us', 'advertisement',
+    'subscribe', 'newsletter', 'social media', 'facebook',
+    'twitter', 'linkedin', 'youtube', 'instagram'
+)
+LINK_NEWS_PATTERNS = (
+    'announces', 'launches', 'reports', 'reveals', 'introduces',
+    'celebrates', 'partners', 'expands', 'invests', 'acquires',
+    'appoints', 'awards', 'recognizes', 'develops', 'innovates',
+    'challenges', 'opportunities', 'growth', 'development',
+    'industry', 'market', 'trade', 'export', 'import',
+    'technology', 'innovation', 'sustainability', 'compliance'
+)
+GENERIC_LINK_TITLES = frozenset(('read more', 'read original article', 'click here', 'learn more'))
+
+# Article body checks: static/contact boilerplate versus news wording
+STATIC_CONTENT_PATTERNS = (
+    'house-', 'road-', 'floor', 'dhaka', 'bangladesh',
+    'info@', 'phone:', 'tel:', 'fax:', 'email:',
+    'copyright', '©', 'all rights reserved', 'privacy',
+    'terms', 'contact us', 'about us', 'advertisement'
+)
+NEWS_CONTENT_PATTERNS = (
+    'announces', 'launches', 'reports', 'reveals', 'introduces',
+    'celebrates', 'partners', 'expands', 'invests', 'acquires',
+    'appoints', 'awards', 'recognizes', 'develops', 'innovates',
+    'challenges', 'opportunities', 'growth', 'development',
+    'industry', 'market', 'trade', 'export', 'import'
+)
+
+TEXT_POSITIVE_RE = _compile_patterns(TEXT_POSITIVE_CUES)
+TEXT_NEGATIVE_RE = _compile_patterns(TEXT_NEGATIVE_CUES)
+
+# News titles shouldn't have a digit in their first five characters; \d covers
+# Unicode decimal digits such as Bengali ones, but not superscripts like '²'
+TITLE_LEADING_DIGIT_RE = re.compile(r'.{0,4}\d', re.DOTALL)
+
+def _selector_xpath(selector: str) -> etree.XPath:
+    """Compile a tag ('h1') or class ('.post-title') selector into an XPath for its first match"""
+    if selector.startswith('.'):
+        step = f"*[contains(concat(' ', normalize-space(@class), ' '), ' {selector[1:]} ')]"
+    else:
+        step = selector
+    return etree.XPath(f"(//{step})[1]")
+
+# Article page extraction: candidate elements for each field, in order of preference
+ARTICLE_TITLE_XPATHS = tuple(_selector_xpath(s) for s in (
+    'h1', '.article-title', '.post-title', '.entry-title', '.headline', 'title'
+))
+ARTICLE_CONTENT_XPATHS = tuple(_selector_xpath(s) for s in (
+    '.article-content', '.post-content', '.entry-content', '.content',
+    'article', '.article-body', '.post-body', '.story-content'
+))
+ARTICLE_DATE_XPATHS = tuple(_selector_xpath(s) for s in (
+    '.published-date', '.post-date', '.article-date', '.date', 'time', '.timestamp'
+))
+ARTICLE_AUTHOR_XPATHS = tuple(_selector_xpath(s) for s in (
+    '.author', '.post-author', '.article-author', '.byline', '.writer'
+))
+# Page furniture dropped before extracting the article body
+ARTICLE_BOILERPLATE_XPATH = etree.XPath(
+    "//script | //style | //nav | //header | //footer | //aside | //advertisement"
+)
+CONTENT_BLOCKS_XPATH = etree.XPath(".//p | .//div")
+PARAGRAPHS_XPATH = etree.XPath("//p")
+
+def _element_text(element: HtmlElement) -> str:
+    """Text of an element and its descendants, with whitespace collapsed"""
+    return " ".join(element.text_content().split())
+
+# Every link-title filter, matched in a single pass over the lowercased title
+LINK_TITLE_AUTOMATON = _build_automaton({
+    "non_news": NON_NEWS_TITLE_PATTERNS,
+    "news": NEWS_TITLE_PATTERNS,
+    "nav": LINK_NAVIGATION_WORDS,
+    "static": LINK_STATIC_PATTERNS,
+    "link_news": LINK_NEWS_PATTERNS,
+})
+# URL filters for links, likewise in a single pass over the lowercased URL
+LINK_URL_AUTOMATON = _build_automaton({
+    "non_news": NON_NEWS_URL_PATTERNS,
+    "news_structure": NEWS_URL_STRUCTURE,
+})
+# RMG relevance: any keyword in the lowercased text
+RMG_AUTOMATON = _build_automaton({"rmg": RMG_KEYWORDS})
+# Fallback sentiment and topics; every distinct keyword present counts
+SENTIMENT_AUTOMATON = _build_automaton({"positive": POSITIVE_KEYWORDS, "negative": NEGATIVE_KEYWORDS})
+TOPIC_AUTOMATON = _build_automaton({"topic": TOPIC_KEYWORDS})
+# Article body scoring, one pass over the lowercased content
+ARTICLE_CONTENT_AUTOMATON = _build_automaton({
+    "static": STATIC_CONTENT_PATTERNS,
+    "news": NEWS_CONTENT_PATTERNS,
+})
+
 class AgnoService:
     """Service for AI analysis using Deepseek V3 API"""
     
@@ -22,10 +415,122 @@ class AgnoService:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.deepseek_api_key}"
         }
+        self._limiter = AsyncLimiter(DEEPSEEK_REQUESTS_PER_MINUTE, 60)
+        self._clean_semaphore = asyncio.Semaphore(CLEAN_CONCURRENCY)
+        # Per-host gate spacing out page requests; see _wait_for_domain
+        self._domain_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._domain_next_request: Dict[str, float] = {}
+        # Shared keep-alive pool for Deepseek and the scraped sites; the Deepseek
+        # headers are passed per request so the API key never reaches other hosts.
+        # HTTP/2, where the server offers it, multiplexes concurrent requests to
+        # one host (e.g. Deepseek) over a single connection
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+            timeout=30.0,
+            follow_redirects=True
+        )
+        # Serialized analyses by cache key, least recently used first
+        self._analysis_lru: OrderedDict[str, bytes] = OrderedDict()
+    
+    def _analysis_cache_key(self, article_text: str, title: str) -> str:
+        digest = hashlib.blake2b(f"{title}|{article_text}".encode(), digest_size=16).hexdigest()
+        return f"analysis:{digest}"
+    
+    def _remember_analysis(self, key: str, value: bytes):
+        self._analysis_lru[key] = value
+        self._analysis_lru.move_to_end(key)
+        if len(self._analysis_lru) > ANALYSIS_LRU_SIZE:
+            self._analysis_lru.popitem(last=False)
+    
+    async def _get_cached_analysis(self, key: str) -> Optional[Dict]:
+        hit = self._analysis_lru.get(key)
+        if hit is not None:
+            self._analysis_lru.move_to_end(key)
+        else:
+            hit = await result_cache.get(key)
+            if hit is None:
+                return None
+            self._remember_analysis(key, hit)
+        # Decode on every hit so callers never share a dict
+        return orjson.loads(hit)
+    
+    async def _cache_analysis(self, key: str, analysis: Dict):
+        # Only Deepseek results are worth keeping; fallbacks are cheap to recompute
+        if analysis.get("method") == "deepseek":
+            value = orjson.dumps(analysis)
+            self._remember_analysis(key, value)
+            await result_cache.set(key, value, ANALYSIS_CACHE_TTL)
+    
+    async def aclose(self):
+        """Close the pooled HTTP client"""
+        await self._client.aclose()
+    
+    async def _post_deepseek(self, payload: Dict, timeout: Optional[float] = None) -> httpx.Response:
+        """
+        POST a chat completion to Deepseek within the request budget, retrying
+        rate-limited and 5xx responses with exponential backoff and jitter
+        
+        Returns the last response, which callers check for success as before.
+        """
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        # Serialized once with orjson, reused across retries
+        body = orjson.dumps(payload)
+        for attempt in range(DEEPSEEK_MAX_RETRIES + 1):
+            async with self._limiter:
+                response = await self._client.post(
+                    self.deepseek_url,
+                    content=body,
+                    headers=self.headers,
+                    **kwargs
+                )
+            if response.status_code not in DEEPSEEK_RETRY_STATUSES or attempt == DEEPSEEK_MAX_RETRIES:
+                return response
+            
+            delay = 2 ** attempt + random.random()
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+            delay = min(delay, DEEPSEEK_MAX_RETRY_DELAY)
+            logger.warning(
+                "Deepseek returned %s, retrying in %.1fs (attempt %s of %s)",
+                response.status_code, delay, attempt + 1, DEEPSEEK_MAX_RETRIES
+            )
+            await asyncio.sleep(delay)
+    
+    async def _wait_for_domain(self, url: str):
+        """Wait until DOMAIN_REQUEST_INTERVAL has passed since the last request to url's host"""
+        host = urlparse(url).netloc
+        async with self._domain_locks[host]:
+            delay = self._domain_next_request.get(host, 0.0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._domain_next_request[host] = time.monotonic() + DOMAIN_REQUEST_INTERVAL
+    
+    async def _fetch_page(self, url: str, headers: Dict) -> Tuple[bytes, Optional[str]]:
+        """
+        Stream a page body, stopping after MAX_PAGE_BYTES
+        
+        Returns the body and the charset declared in its Content-Type, if any,
+        so the parser can decode it once without sniffing the encoding.
+        """
+        await self._wait_for_domain(url)
+        body = bytearray()
+        async with self._client.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) >= MAX_PAGE_BYTES:
+                    logger.warning(f"Truncated {url} at {MAX_PAGE_BYTES} bytes")
+                    del body[MAX_PAGE_BYTES:]
+                    break
+            encoding = response.charset_encoding
+        return bytes(body), encoding
     
     async def analyze_article(self, article_text: str, title: str) -> Dict:
         """
-        Analyze a news article using Deepseek V3
+        Analyze a news article using Deepseek V3, reusing earlier results for
+        the same title and text
         
         Args:
             article_text: The full text of the article
@@ -34,41 +539,30 @@ class AgnoService:
         Returns:
             Dict containing analysis results
         """
+        key = self._analysis_cache_key(article_text, title)
+        cached_analysis = await self._get_cached_analysis(key)
+        if cached_analysis is not None:
+            return cached_analysis
+        
+        analysis = await self._request_analysis(article_text, title)
+        await self._cache_analysis(key, analysis)
+        return analysis
+    
+    async def _request_analysis(self, article_text: str, title: str) -> Dict:
+        """Run a single-article Deepseek analysis"""
         if not self.deepseek_api_key:
             logger.warning("Deepseek API key not configured, using fallback analysis")
             return self._get_fallback_analysis(article_text, title)
         
         try:
-            prompt = f"""
-            Analyze this RMG (Ready-Made Garment) industry news article and provide detailed insights.
-            
-            Title: {title}
-            Article: {article_text}
-            
-            Please provide analysis in the following JSON format:
-            {{
-                "sentiment": {{
-                    "label": "positive/negative/neutral",
-                    "score": -1.0 to 1.0,
-                    "confidence": 0.0 to 1.0
-                }},
-                "key_insights": "2-3 key insights about the article",
-                "market_impact": "high/medium/low",
-                "topics": ["topic1", "topic2", "topic3"],
-                "geographic_impact": "regions affected",
-                "industry_sectors": ["sector1", "sector2"],
-                "business_implications": "what this means for businesses"
-            }}
-            
-            Focus on the RMG industry context and provide actionable insights.
-            """
+            prompt = f"{_ANALYZE_PROMPT_PREFIX}\n\n---\nTitle: {title}\nArticle: {article_text}"
             
             payload = {
                 "model": "deepseek-chat",
                 "messages": [
                     {
                         "role": "system",
-                        "content": "You are an expert analyst specializing in the Ready-Made Garment (RMG) industry. Provide accurate, insightful analysis of news articles with focus on market impact, trends, and business implications. Always respond with valid JSON format."
+                        "content": _ANALYZE_SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -79,51 +573,171 @@ class AgnoService:
                 "max_tokens": 1000
             }
             
-            response = requests.post(
-                self.deepseek_url,
-                json=payload,
-                headers=self.headers,
-                timeout=30
-            )
+            response = await self._post_deepseek(payload)
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
+                self._log_prompt_cache_usage(result)
                 content = result["choices"][0]["message"]["content"]
                 
                 # Try to parse JSON response
                 try:
-                    analysis_data = json.loads(content)
-                    return {
-                        "analysis_id": f"deepseek_{datetime.now().timestamp()}",
-                        "sentiment": analysis_data.get("sentiment", {}),
-                        "key_insights": analysis_data.get("key_insights", ""),
-                        "market_impact": analysis_data.get("market_impact", "medium"),
-                        "topics": analysis_data.get("topics", []),
-                        "geographic_impact": analysis_data.get("geographic_impact", ""),
-                        "industry_sectors": analysis_data.get("industry_sectors", []),
-                        "business_implications": analysis_data.get("business_implications", ""),
-                        "confidence": analysis_data.get("sentiment", {}).get("confidence", 0.8),
-                        "method": "deepseek"
-                    }
-                except json.JSONDecodeError:
-                    # If JSON parsing fails, extract insights from text
-                    return self._parse_deepseek_text_response(content, article_text, title)
+                    analysis_data = orjson.loads(content)
+                    if isinstance(analysis_data, dict):
+                        return self._format_deepseek_analysis(analysis_data)
+                except orjson.JSONDecodeError:
+                    pass
+                # If the response isn't a JSON object, extract insights from text
+                return self._parse_deepseek_text_response(content, article_text, title)
             else:
                 logger.error(f"Deepseek API error: {response.status_code} - {response.text}")
                 return self._get_fallback_analysis(article_text, title)
                 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Deepseek API request failed: {str(e)}")
             return self._get_fallback_analysis(article_text, title)
     
+    async def analyze_articles_batch(self, items: List[Tuple[str, str]]) -> List[Dict]:
+        """
+        Analyze several news articles, sending the ones without a cached
+        analysis to Deepseek V3 in concurrent batched requests
+        
+        Args:
+            items: List of (article_text, title) tuples
+            
+        Returns:
+            List of analysis dicts, in the same order as items
+        """
+        keys = [self._analysis_cache_key(article_text, title) for article_text, title in items]
+        results = [await self._get_cached_analysis(key) for key in keys]
+        misses = [i for i, analysis in enumerate(results) if analysis is None]
+        
+        chunks = self._chunk_batch(items, misses)
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        
+        async def analyze_chunk(chunk: List[int]) -> List[Dict]:
+            async with semaphore:
+                return await self._request_analyses_batch([items[i] for i in chunk])
+        
+        for chunk, analyses in zip(chunks, await asyncio.gather(*(analyze_chunk(chunk) for chunk in chunks))):
+            for i, analysis in zip(chunk, analyses):
+                results[i] = analysis
+                await self._cache_analysis(keys[i], analysis)
+        
+        return results
+    
+    def _chunk_batch(self, items: List[Tuple[str, str]], indices: List[int]) -> List[List[int]]:
+        """Group item indices into batches within the article and prompt size limits"""
+        chunks = []
+        chunk, chars = [], 0
+        for i in indices:
+            article_text, title = items[i]
+            size = len(article_text) + len(title)
+            if chunk and (len(chunk) == BATCH_MAX_ARTICLES or chars + size > BATCH_CHAR_BUDGET):
+                chunks.append(chunk)
+                chunk, chars = [], 0
+            chunk.append(i)
+            chars += size
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+    
+    async def _request_analyses_batch(self, items: List[Tuple[str, str]]) -> List[Dict]:
+        """Run one Deepseek request analyzing every item"""
+        if not self.deepseek_api_key:
+            logger.warning("Deepseek API key not configured, using fallback analysis")
+            return [self._get_fallback_analysis(article_text, title) for article_text, title in items]
+        
+        try:
+            articles = "\n\n".join(
+                f"[{i}] Title: {title}\nArticle: {article_text}"
+                for i, (article_text, title) in enumerate(items)
+            )
+            
+            prompt = f"{_BATCH_PROMPT_PREFIX}\n\n---\n{len(items)} articles:\n\n{articles}"
+            
+            payload = {
+                "model": "deepseek-chat",
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": _BATCH_SYSTEM_PROMPT
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                "temperature": 0.3,
+                "max_tokens": min(8000, 1000 * len(items)),
+                "response_format": {"type": "json_object"}
+            }
+            
+            response = await self._post_deepseek(payload, timeout=60)
+            
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                self._log_prompt_cache_usage(result)
+                content = result["choices"][0]["message"]["content"]
+                
+                try:
+                    analyses = orjson.loads(content)
+                    if isinstance(analyses, dict):
+                        analyses = analyses.get("analyses")
+                    if isinstance(analyses, list) and len(analyses) == len(items):
+                        # Malformed entries fall back individually instead of failing the batch
+                        return [
+                            self._format_deepseek_analysis(analysis_data)
+                            if isinstance(analysis_data, dict)
+                            else self._get_fallback_analysis(article_text, title)
+                            for analysis_data, (article_text, title) in zip(analyses, items)
+                        ]
+                    logger.error(f"Deepseek batch returned {len(analyses) if isinstance(analyses, list) else 'no'} results for {len(items)} articles")
+                except orjson.JSONDecodeError:
+                    logger.error("Deepseek batch response was not valid JSON")
+            else:
+                logger.error(f"Deepseek API error: {response.status_code} - {response.text}")
+                
+        except httpx.HTTPError as e:
+            logger.error(f"Deepseek batch request failed: {str(e)}")
+        
+        return [self._get_fallback_analysis(article_text, title) for article_text, title in items]
+    
+    def _log_prompt_cache_usage(self, result: Dict):
+        """Log how much of a Deepseek prompt was served from its prefix cache"""
+        usage = result.get("usage") or {}
+        if "prompt_cache_hit_tokens" in usage:
+            logger.debug(
+                "Deepseek prompt cache: %s hit, %s missed tokens",
+                usage["prompt_cache_hit_tokens"], usage.get("prompt_cache_miss_tokens")
+            )
+    
+    def _format_deepseek_analysis(self, analysis_data: Dict) -> Dict:
+        """Normalize a parsed Deepseek analysis into the service's result format"""
+        sentiment = analysis_data.get("sentiment")
+        if not isinstance(sentiment, dict):
+            sentiment = {}
+        return {
+            "analysis_id": f"deepseek_{uuid.uuid4().hex}",
+            "sentiment": sentiment,
+            "key_insights": analysis_data.get("key_insights", ""),
+            "market_impact": analysis_data.get("market_impact", "medium"),
+            "topics": analysis_data.get("topics", []),
+            "geographic_impact": analysis_data.get("geographic_impact", ""),
+            "industry_sectors": analysis_data.get("industry_sectors", []),
+            "business_implications": analysis_data.get("business_implications", ""),
+            "confidence": sentiment.get("confidence", 0.8),
+            "method": "deepseek"
+        }
+    
     def _parse_deepseek_text_response(self, content: str, article_text: str, title: str) -> Dict:
         """Parse Deepseek text response when JSON parsing fails"""
         # Simple sentiment detection from text
         text_lower = content.lower()
-        if any(word in text_lower for word in ["positive", "growth", "increase", "success"]):
+        if TEXT_POSITIVE_RE.search(text_lower):
             sentiment = "positive"
             score = 0.7
-        elif any(word in text_lower for word in ["negative", "decline", "crisis", "problem"]):
+        elif TEXT_NEGATIVE_RE.search(text_lower):
             sentiment = "negative"
             score = -0.7
         else:
@@ -131,7 +745,7 @@ class AgnoService:
             score = 0.0
         
         return {
-            "analysis_id": f"deepseek_text_{datetime.now().timestamp()}",
+            "analysis_id": f"deepseek_text_{uuid.uuid4().hex}",
             "sentiment": {
                 "label": sentiment,
                 "score": score,
@@ -160,7 +774,15 @@ class AgnoService:
             return self._get_fallback_topics()
         
         try:
-            combined_text = " ".join(article_texts[:5])  # Limit to avoid token limits
+            # Fill the token budget (~4 characters per token), truncating the last article that fits
+            parts = []
+            chars_left = TRENDING_TOKEN_BUDGET * 4
+            for text in article_texts:
+                if chars_left <= 0:
+                    break
+                parts.append(text[:chars_left])
+                chars_left -= len(parts[-1]) + 1
+            combined_text = " ".join(parts)
             
             prompt = f"""
             Analyze these RMG industry articles and identify the top 5 trending topics:
@@ -189,42 +811,36 @@ class AgnoService:
                     }
                 ],
                 "temperature": 0.3,
-                "max_tokens": 500
+                "max_tokens": 500,
+                "response_format": {"type": "json_object"}
             }
             
-            response = requests.post(
-                self.deepseek_url,
-                json=payload,
-                headers=self.headers,
-                timeout=30
-            )
+            response = await self._post_deepseek(payload)
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 content = result["choices"][0]["message"]["content"]
                 
                 try:
-                    topics_data = json.loads(content)
+                    topics_data = orjson.loads(content)
                     return topics_data.get("topics", [])
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     return self._get_fallback_topics()
             else:
                 return self._get_fallback_topics()
                 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Trending topics API failed: {str(e)}")
             return self._get_fallback_topics()
     
     def _get_fallback_analysis(self, article_text: str, title: str) -> Dict:
         """Fallback analysis when Agno is unavailable"""
-        # Simple keyword-based sentiment analysis
-        positive_keywords = ["growth", "increase", "profit", "expansion", "success", "boost", "rise"]
-        negative_keywords = ["decline", "loss", "crisis", "drop", "fall", "recession", "problem"]
-        
+        # Simple keyword-based sentiment analysis: number of distinct keywords present
         text_lower = (article_text + " " + title).lower()
         
-        positive_score = sum(1 for word in positive_keywords if word in text_lower)
-        negative_score = sum(1 for word in negative_keywords if word in text_lower)
+        matches = _match_patterns(SENTIMENT_AUTOMATON, text_lower)
+        positive_score = len(matches.get("positive", ()))
+        negative_score = len(matches.get("negative", ()))
         
         if positive_score > negative_score:
             sentiment = "positive"
@@ -237,7 +853,7 @@ class AgnoService:
             score = 0.0
         
         return {
-            "analysis_id": f"fallback_{datetime.now().timestamp()}",
+            "analysis_id": f"fallback_{uuid.uuid4().hex}",
             "sentiment": {
                 "label": sentiment,
                 "score": score,
@@ -262,19 +878,12 @@ class AgnoService:
     
     def _extract_simple_topics(self, text: str) -> List[str]:
         """Simple topic extraction"""
-        rmg_keywords = [
-            "garment", "textile", "fashion", "apparel", "clothing",
-            "manufacturing", "export", "cotton", "fabric", "factory"
-        ]
-        
-        found_topics = []
-        for keyword in rmg_keywords:
-            if keyword in text:
-                found_topics.append(keyword.title())
+        found = _match_patterns(TOPIC_AUTOMATON, text).get("topic", ())
+        found_topics = [keyword.title() for keyword in TOPIC_KEYWORDS if keyword in found]
         
         return found_topics[:5]  # Limit to 5 topics
 
-    async def scrape_news_website(self, url: str, max_articles: int = 15, db: Session = None, store_callback=None) -> List[Dict]:
+    async def scrape_news_website(self, url: str, max_articles: int = 15, db: AsyncSession = None, store_callback=None) -> List[Dict]:
         """
         Scrape news articles from a website with full content extraction using web scraping + AI analysis
         
@@ -287,433 +896,263 @@ class AgnoService:
         Returns:
             List of article dictionaries with full content
         """
-        print(f"🚀 Starting to scrape: {url}")
+        logger.debug("Starting to scrape: %s", url)
         try:
             # Step 1: Extract article links from the main page using web scraping
-            print(f"📋 Step 1: Extracting article links from {url}")
             article_links = await self._scrape_article_links(url, max_articles)
             
             if not article_links:
-                print(f"❌ No article links found on {url}")
                 logger.warning(f"No article links found on {url}")
                 return []
             
-            print(f"✅ Found {len(article_links)} article links")
-            
             # Step 2: Extract full content from each article
-            print(f"📄 Step 2: Extracting content from {len(article_links)} articles")
+            article_links = article_links[:max_articles]
+            logger.debug("Found %s article links on %s", len(article_links), url)
+            
+            # Check for duplicates BEFORE content extraction and AI cleaning
+            if store_callback and db:
+                # One query for every candidate URL instead of one per link
+                try:
+                    result = await db.execute(
+                        select(NewsArticle.url).where(NewsArticle.url.in_([link['url'] for link in article_links]))
+                    )
+                    existing_urls = set(result.scalars())
+                except Exception as e:
+                    logger.warning("Duplicate check failed for %s: %s", url, e)
+                    # Continue with extraction if duplicate check fails
+                    existing_urls = set()
+                
+                new_links = []
+                for link_data in article_links:
+                    if link_data['url'] in existing_urls:
+                        logger.debug("Article already exists (skipping): %s", link_data['url'])
+                    else:
+                        logger.debug("Article is new, proceeding with extraction: %s", link_data['url'])
+                        new_links.append(link_data)
+                article_links = new_links
+            
+            # Fetch article pages concurrently, bounded to stay polite to the site
+            semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+            
+            async def extract(i: int, link_data: Dict) -> Optional[Dict]:
+                async with semaphore:
+                    logger.debug("Processing article %s/%s: %s", i + 1, len(article_links), link_data['url'])
+                    return await self._scrape_article_content(link_data['url'])
+            
+            contents = await asyncio.gather(
+                *(extract(i, link_data) for i, link_data in enumerate(article_links)),
+                return_exceptions=True
+            )
+            
+            # Store results in page order; the database session is not shared across tasks
             articles = []
             stored_count = 0
-            for i, link_data in enumerate(article_links[:max_articles]):
-                try:
-                    print(f"  📖 Processing article {i+1}/{len(article_links)}: {link_data['url']}")
+            for link_data, full_content in zip(article_links, contents):
+                if isinstance(full_content, Exception):
+                    logger.error(f"Error extracting content from {link_data['url']}: {str(full_content)}")
+                    continue
+                
+                if full_content:
+                    article = {
+                        "title": link_data.get('title', full_content.get('title', '')),
+                        "content": full_content.get('content', ''),
+                        "summary": full_content.get('summary'),
+                        "url": link_data['url'],
+                        "published_at": full_content.get('published_at', link_data.get('published_at', datetime.now())),
+                        "author": full_content.get('author', link_data.get('author', ''))
+                    }
+                    articles.append(article)
                     
-                    # Check for duplicates BEFORE content extraction and AI cleaning
+                    # Store article immediately if callback is provided
                     if store_callback and db:
-                        # Create a minimal article structure for duplicate check
-                        check_article = {
-                            "url": link_data['url'],
-                            "title": link_data.get('title', ''),
-                            "content": "",  # Will be filled later if not duplicate
-                            "published_at": link_data.get('published_at', datetime.now()),
-                            "author": link_data.get('author', '')
-                        }
-                        
-                        # Quick duplicate check using URL only
                         try:
-                            # Check if URL already exists in database
-                            existing = db.query(NewsArticle).filter(NewsArticle.url == link_data['url']).first()
-                            if existing:
-                                print(f"  ⚠️  Article already exists (skipping): {link_data['url']}")
-                                continue  # Skip this article entirely
+                            stored = await store_callback(article, db)
+                            if stored:
+                                stored_count += 1
+                                logger.debug("Stored article: %s", link_data['url'])
                             else:
-                                print(f"  ✅ Article is new, proceeding with extraction: {link_data['url']}")
+                                logger.debug("Article already exists or failed to store: %s", link_data['url'])
                         except Exception as e:
-                            print(f"  ❌ Error checking for duplicates: {str(e)}")
-                            # Continue with extraction if duplicate check fails
+                            logger.error("Error storing article %s: %s", link_data['url'], e)
                     
-                    # Only extract content if article is new
-                    full_content = await self._scrape_article_content(link_data['url'])
-                    if full_content:
-                        article = {
-                            "title": link_data.get('title', full_content.get('title', '')),
-                            "content": full_content.get('content', ''),
-                            "url": link_data['url'],
-                            "published_at": full_content.get('published_at', link_data.get('published_at', datetime.now())),
-                            "author": full_content.get('author', link_data.get('author', ''))
-                        }
-                        articles.append(article)
-                        
-                        # Store article immediately if callback is provided
-                        if store_callback and db:
-                            try:
-                                stored = await store_callback(article, db)
-                                if stored:
-                                    stored_count += 1
-                                    print(f"  💾 Immediately stored article: {link_data['url']}")
-                                else:
-                                    print(f"  ⚠️  Article already exists or failed to store: {link_data['url']}")
-                            except Exception as e:
-                                print(f"  ❌ Error storing article: {str(e)}")
-                        
-                        print(f"  ✅ Successfully extracted content from: {link_data['url']}")
-                        logger.info(f"Extracted content from: {link_data['url']}")
-                    else:
-                        print(f"  ⚠️  No content extracted from: {link_data['url']}")
-                except Exception as e:
-                    print(f"  ❌ Error extracting content from {link_data['url']}: {str(e)}")
-                    logger.error(f"Error extracting content from {link_data['url']}: {str(e)}")
-                    continue
+                    logger.debug("Extracted content from: %s", link_data['url'])
+                else:
+                    logger.debug("No content extracted from: %s", link_data['url'])
             
-            print(f"🎉 Successfully scraped {len(articles)} articles with full content from {url}")
             logger.info(f"Successfully scraped {len(articles)} articles with full content from {url}")
             return articles
                 
         except Exception as e:
-            print(f"💥 Web scraping failed for {url}: {str(e)}")
             logger.error(f"Web scraping failed for {url}: {str(e)}")
             return []
 
     async def _scrape_article_links(self, url: str, max_articles: int) -> List[Dict]:
         """Extract article links using web scraping"""
-        print(f"  🔗 Fetching main page: {url}")
         try:
             # Fetch the main page with enhanced headers
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Cache-Control': 'max-age=0'
-            }
-            
-            print(f"  📡 Making HTTP request to {url}")
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            print(f"  ✅ HTTP request successful, status: {response.status_code}")
+            page, encoding = await self._fetch_page(url, LISTING_PAGE_HEADERS)
             
             # Check if we got actual content
-            if len(response.content) < 1000:
-                print(f"  ⚠️  Response content seems too small: {len(response.content)} bytes")
-                print(f"  📄 Response content preview: {response.text[:200]}...")
-            
-            print(f"  🔍 Parsing HTML content...")
-            soup = BeautifulSoup(response.content, 'html.parser')
-            print(f"  ✅ HTML parsed successfully")
+            if len(page) < 1000:
+                logger.warning("Response from %s seems too small: %s bytes", url, len(page))
             
-            # Debug: Print page title and some basic info
-            page_title = soup.find('title')
-            if page_title:
-                print(f"  📄 Page title: {page_title.get_text(strip=True)}")
+            # Parsing is CPU-bound; keep it off the event loop
+            return await asyncio.to_thread(self._parse_links_sync, page, encoding, url, max_articles)
             
-            # Debug: Count all links on the page
-            all_links = soup.find_all('a', href=True)
-            print(f"  🔗 Total links found on page: {len(all_links)}")
-            
-            # Debug: Show first few links for analysis
-            print(f"  🔍 First 5 links on page:")
-            for i, link in enumerate(all_links[:5]):
-                href = link.get('href', '')
-                text = link.get_text(strip=True)
-                print(f"    {i+1}. '{text[:50]}...' -> {href}")
-            
-            # Debug: Check if page content is loaded
-            print(f"  🔍 Page content analysis:")
-            print(f"    📄 HTML length: {len(response.content)} characters")
-            print(f"    📄 Response encoding: {response.encoding}")
-            
-            # Debug: Look for specific content patterns
-            page_text = soup.get_text()
-            if "Oxford Knit Composite" in page_text:
-                print(f"    ✅ Found expected content: 'Oxford Knit Composite'")
-            else:
-                print(f"    ❌ Expected content not found")
-            
-            # Debug: Check for common blocking patterns
-            if "blocked" in page_text.lower() or "captcha" in page_text.lower():
-                print(f"    ⚠️  Possible blocking detected")
-            
-            # Debug: Show some raw HTML for analysis
-            print(f"  🔍 Sample HTML structure:")
-            sample_html = str(soup)[:1000]
-            print(f"    {sample_html[:200]}...")
-            
-            # Extract article links based on common patterns
-            article_links = []
-            
-            # Look for article links in various selectors
-            selectors = [
-                # Generic article patterns
-                'a[href*="/article/"]',
-                'a[href*="/news/"]',
-                'a[href*="/story/"]',
-                'a[href*="/post/"]',
-                'a[href*="/page/"]',
-                'a[href*="/category/"]',
+        except Exception as e:
+            logger.error(f"Failed to scrape article links from {url}: {str(e)}")
+            return []
+
+    def _parse_links_sync(self, page: bytes, encoding: Optional[str], url: str, max_articles: int) -> List[Dict]:
+        """Collect the news article links from a fetched listing page"""
+        from bs4 import BeautifulSoup
+        
+        soup = BeautifulSoup(page, 'lxml', from_encoding=encoding)
+        
+        # One traversal for all article selectors; fall back to every link on the page
+        links = soup.select(ARTICLE_LINK_SELECTOR)
+        if not links:
+            links = soup.find_all('a', href=True)
+            logger.debug("No article selector matched on %s, checking all %s links", url, len(links))
+        
+        all_found_links = []
+        # URLs already in all_found_links; rejected URLs stay eligible since a
+        # later anchor for the same page (e.g. the headline after a thumbnail) may carry the title
+        seen_urls = set()
+        # Links outside the listing's own section (before any /page/N) count as external
+        base_url = url.split('/page/', 1)[0]
+        
+        for link in links:
+            href = link.get('href')
+            if href:
+                # Make URL absolute
+                full_url = urljoin(url, href)
                 
-                # Common article containers
-                'article a',
-                '.article a',
-                '.news-item a',
-                '.post a',
-                '.news a',
-                '.content a',
-                '.main-content a',
+                # Skip if already found
+                if full_url in seen_urls:
+                    continue
                 
-                # Headers with links
-                'h1 a',
-                'h2 a',
-                'h3 a',
-                'h4 a',
-                '.entry-title a',
-                '.post-title a',
-                '.article-title a',
-                '.headline a',
-                '.title a',
+                # Extract title
+                title = link.get_text(strip=True)
+                if not title:
+                    # Try to find title in parent elements
+                    parent = link.find_parent(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+                    if parent:
+                        title = parent.get_text(strip=True)
+                title_lower = title.lower()
+                title_matches = _match_buckets(LINK_TITLE_AUTOMATON, title_lower)
                 
-                # Specific to BGMEA and Financial Express
-                '.news-list a',
-                '.news-container a',
-                '.news-block a',
-                '.news-section a',
-                '.all-news a',
-                '.special-issues a',
-                '.rmg-textile a',
+                # IMMEDIATE NEWS LINK VALIDATION
+                is_valid_news_link = self._validate_news_link(title, full_url, href, title_matches)
+                if not is_valid_news_link:
+                    continue
                 
-                # Textile Today specific (based on image analysis)
-                '.category a',
-                '.news-analysis a',
-                '.textile-apparel a',
-                '.main-content a',
-                '.content-area a',
-                '.article-list a',
-                '.news-grid a',
-                '.post-grid a',
+                # Skip empty titles and very short titles
+                if not title or len(title) < 5:  # Reduced from 10 to 5
+                    logger.debug("Skipped %s: title too short or empty", full_url)
+                    continue
                 
-                # WordPress specific (common for news sites)
-                '.entry a',
-                '.post a',
-                '.blog-post a',
-                '.news-post a',
+                # Skip navigation, footer, and other non-article links (relaxed)
+                if "nav" in title_matches:  # Removed 'home', 'about', 'contact', 'menu', 'navigation'
+                    logger.debug("Skipped %s: navigation link", full_url)
+                    continue
                 
-                # Fallback: all links (will be filtered later)
-                'a[href]'
-            ]
-            
-            print(f"  🔍 Searching for article links using {len(selectors)} selectors...")
-            all_found_links = []
-            
-            for i, selector in enumerate(selectors):
-                print(f"    🔎 Trying selector {i+1}/{len(selectors)}: {selector}")
-                links = soup.select(selector)
-                print(f"    📊 Found {len(links)} links with selector: {selector}")
+                # Skip static content and contact information
+                if "static" in title_matches:
+                    logger.debug("Skipped %s: static content/contact info", full_url)
+                    continue
                 
-                for link in links:
-                    href = link.get('href')
-                    if href:
-                        # Make URL absolute
-                        full_url = urljoin(url, href)
-                        
-                        # Skip if already found
-                        if any(link['url'] == full_url for link in all_found_links):
-                            continue
-                        
-                        # Extract title
-                        title = link.get_text(strip=True)
-                        if not title:
-                            # Try to find title in parent elements
-                            parent = link.find_parent(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                            if parent:
-                                title = parent.get_text(strip=True)
-                        
-                        # Debug: Show what we found
-                        print(f"    🔍 Processing link: '{title[:50]}...' -> {full_url}")
-                        
-                        # IMMEDIATE NEWS LINK VALIDATION
-                        is_valid_news_link = self._validate_news_link(title, full_url, href)
-                        if not is_valid_news_link:
-                            continue
-                        
-                        # Skip empty titles and very short titles
-                        if not title or len(title) < 5:  # Reduced from 10 to 5
-                            print(f"      ❌ Skipped: Title too short or empty (length: {len(title) if title else 0})")
-                            continue
-                        
-                        # Skip navigation, footer, and other non-article links (relaxed)
-                        if any(skip_word in title.lower() for skip_word in ['login', 'register', 'search']):  # Removed 'home', 'about', 'contact', 'menu', 'navigation'
-                            print(f"      ❌ Skipped: Contains navigation word")
-                            continue
-                        
-                        # Skip static content and contact information
-                        static_content_patterns = [
-                            'house-', 'road-', 'floor', 'dhaka', 'bangladesh',
-                            'info@', '@', 'phone', 'tel:', 'fax:', 'email:',
-                            'copyright', '©', 'all rights reserved', 'privacy',
-                            'terms', 'contact us', 'about us', 'advertisement',
-                            'subscribe', 'newsletter', 'social media', 'facebook',
-                            'twitter', 'linkedin', 'youtube', 'instagram'
-                        ]
-                        
-                        if any(pattern in title.lower() for pattern in static_content_patterns):
-                            print(f"      ❌ Skipped: Static content/contact info")
-                            continue
-                        
-                        # Skip very short or generic titles
-                        if len(title) < 15 or title.lower() in ['read more', 'read original article', 'click here', 'learn more']:
-                            print(f"      ❌ Skipped: Generic or too short title")
-                            continue
-                        
-                        # Skip external links (optional) - but be more lenient
-                        base_url = url.split('/page/')[0] if '/page/' in url else url
-                        if not full_url.startswith(base_url):
-                            print(f"      ❌ Skipped: External link (base: {base_url})")
-                            continue
-                        
-                        # Additional check: Look for news-like patterns in the title
-                        news_patterns = [
-                            'announces', 'launches', 'reports', 'reveals', 'introduces',
-                            'celebrates', 'partners', 'expands', 'invests', 'acquires',
-                            'appoints', 'awards', 'recognizes', 'develops', 'innovates',
-                            'challenges', 'opportunities', 'growth', 'development',
-                            'industry', 'market', 'trade', 'export', 'import',
-                            'technology', 'innovation', 'sustainability', 'compliance'
-                        ]
-                        
-                        # Check if title contains news-like content
-                        has_news_content = any(pattern in title.lower() for pattern in news_patterns)
-                        
-                        # Also check if title looks like a proper news headline (has proper capitalization, length)
-                        looks_like_headline = (
-                            len(title) >= 20 and 
-                            len(title) <= 200 and
-                            title[0].isupper() and
-                            not title.isupper() and  # Not all caps
-                            not title.islower()      # Not all lowercase
-                        )
-                        
-                        if has_news_content or looks_like_headline:
-                            all_found_links.append({
-                                'title': title,
-                                'url': full_url,
-                                'published_at': datetime.now(),
-                                'author': ''
-                            })
-                            print(f"    ✅ Added news-like link: {title[:50]}... -> {full_url}")
-                        else:
-                            print(f"    ⚠️  Skipped: Doesn't look like news content")
+                # Skip very short or generic titles
+                if len(title) < 15 or title_lower in GENERIC_LINK_TITLES:
+                    logger.debug("Skipped %s: generic or too short title", full_url)
+                    continue
                 
-                # If we found links with this selector, don't try the fallback 'a[href]' selector
-                if links and selector != 'a[href]':
-                    break
-            
-            print(f"  📊 Total potential links found: {len(all_found_links)}")
-            
-            # Temporarily disable RMG filtering to see all links
-            print(f"  🔍 Temporarily accepting all links for debugging...")
-            for link_data in all_found_links:
-                article_links.append(link_data)
-                print(f"    ✅ Added article: {link_data['title'][:50]}...")
+                # Skip external links (optional) - but be more lenient
+                if not full_url.startswith(base_url):
+                    logger.debug("Skipped %s: external link (base: %s)", full_url, base_url)
+                    continue
                 
-                if len(article_links) >= max_articles:
-                    print(f"    🎯 Reached max articles limit ({max_articles})")
-                    break
-            
-            print(f"  📊 Total article links found: {len(article_links)}")
-            logger.info(f"Found {len(article_links)} article links on {url}")
-            return article_links
-            
-        except Exception as e:
-            print(f"  💥 Failed to scrape article links from {url}: {str(e)}")
-            logger.error(f"Failed to scrape article links from {url}: {str(e)}")
-            return []
+                # Additional check: Look for news-like patterns in the title
+                has_news_content = "link_news" in title_matches
+                
+                # Also check if title looks like a proper news headline (has proper capitalization, length)
+                looks_like_headline = (
+                    len(title) >= 20 and 
+                    len(title) <= 200 and
+                    title[0].isupper() and
+                    not title.isupper() and  # Not all caps
+                    not title.islower()      # Not all lowercase
+                )
+                
+                if has_news_content or looks_like_headline:
+                    seen_urls.add(full_url)
+                    all_found_links.append({
+                        'title': title,
+                        'url': full_url,
+                        'published_at': datetime.now(),
+                        'author': ''
+                    })
+                    logger.debug("Added news-like link: %s -> %s", title[:50], full_url)
+                else:
+                    logger.debug("Skipped %s: doesn't look like news content", full_url)
+    
+        article_links = all_found_links[:max_articles]
+        logger.info(f"Found {len(article_links)} article links on {url} ({len(links)} candidates)")
+        return article_links
 
     async def _scrape_article_content(self, article_url: str) -> Dict:
         """Extract full article content using web scraping + AI cleaning"""
-        print(f"    📄 Fetching article content: {article_url}")
+        logger.debug("Fetching article content: %s", article_url)
         try:
             # Fetch the article page
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
+            page, encoding = await self._fetch_page(article_url, ARTICLE_PAGE_HEADERS)
             
-            print(f"    📡 Making HTTP request to article page...")
-            response = requests.get(article_url, headers=headers, timeout=30)
-            response.raise_for_status()
-            print(f"    ✅ Article HTTP request successful, status: {response.status_code}")
-            
-            print(f"    🔍 Parsing article HTML...")
-            soup = BeautifulSoup(response.content, 'html.parser')
-            print(f"    ✅ Article HTML parsed successfully")
-            
-            # Extract title
-            print(f"    📝 Extracting title...")
-            title = self._extract_title(soup)
-            print(f"    📝 Title: {title[:50]}..." if title else "    📝 No title found")
-            
-            # Extract content
-            print(f"    📄 Extracting content...")
-            content = self._extract_content(soup)
-            print(f"    📄 Content length: {len(content) if content else 0} characters")
-            
-            # Extract metadata
-            print(f"    📅 Extracting metadata...")
-            published_at = self._extract_date(soup)
-            author = self._extract_author(soup)
-            print(f"    📅 Published: {published_at}, Author: {author}")
+            # Parsing and extraction are CPU-bound; keep them off the event loop
+            title, content, published_at, author = await asyncio.to_thread(self._parse_article_sync, page, encoding)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Parsed %s: title %r, %s characters, published %s, author %r",
+                    article_url, title[:50], len(content) if content else 0, published_at, author
+                )
             
             # Use AI to clean the content if available
             if self.deepseek_api_key and content:
-                print(f"    🤖 Using AI to clean content...")
-                cleaned_content = await self._clean_content_with_ai(content, title)
+                async with self._clean_semaphore:
+                    cleaned_content = await self._clean_content_with_ai(content, title)
                 if cleaned_content:
                     content = cleaned_content
-                    print(f"    🤖 AI cleaned content length: {len(content)} characters")
+                    logger.debug("AI cleaned content of %s: %s characters", article_url, len(content))
                 else:
-                    print(f"    ⚠️  AI cleaning failed, using original content")
+                    logger.debug("AI cleaning failed for %s, using original content", article_url)
             else:
-                print(f"    ⚠️  No AI key or content, skipping AI cleaning")
+                logger.debug("No AI key or content, skipping AI cleaning for %s", article_url)
             
             # Check if content looks like actual news (not static content)
             if content:
-                # Check for static content patterns
-                static_patterns = [
-                    'house-', 'road-', 'floor', 'dhaka', 'bangladesh',
-                    'info@', 'phone:', 'tel:', 'fax:', 'email:',
-                    'copyright', '©', 'all rights reserved', 'privacy',
-                    'terms', 'contact us', 'about us', 'advertisement'
-                ]
-                
-                content_lower = content.lower()
-                static_content_score = sum(1 for pattern in static_patterns if pattern in content_lower)
+                # Count distinct static patterns, stopping as soon as the page is clearly static
+                static_patterns = set()
+                has_news_content = False
+                for _, (buckets, pattern) in ARTICLE_CONTENT_AUTOMATON.iter(content.lower()):
+                    if "static" in buckets:
+                        static_patterns.add(pattern)
+                        if len(static_patterns) > 3:
+                            break
+                    if "news" in buckets:
+                        has_news_content = True
                 
                 # If more than 3 static patterns found, likely not a news article
-                if static_content_score > 3:
-                    print(f"    ❌ Content appears to be static/contact info (score: {static_content_score})")
-                    logger.warning(f"Content appears to be static for {article_url}")
+                if len(static_patterns) > 3:
+                    logger.warning("Content appears to be static for %s", article_url)
                     return None
                 
                 # Check for news-like content patterns
-                news_patterns = [
-                    'announces', 'launches', 'reports', 'reveals', 'introduces',
-                    'celebrates', 'partners', 'expands', 'invests', 'acquires',
-                    'appoints', 'awards', 'recognizes', 'develops', 'innovates',
-                    'challenges', 'opportunities', 'growth', 'development',
-                    'industry', 'market', 'trade', 'export', 'import'
-                ]
-                
-                news_content_score = sum(1 for pattern in news_patterns if pattern in content_lower)
-                
-                if news_content_score < 1:
-                    print(f"    ⚠️  Content doesn't contain news-like patterns (score: {news_content_score})")
+                if not has_news_content:
+                    logger.debug("Content of %s doesn't contain news-like patterns", article_url)
             
             if not content or len(content) < 100:
-                print(f"    ❌ Article content too short or missing ({len(content) if content else 0} chars)")
-                logger.warning(f"Article content too short or missing for {article_url}")
+                logger.warning("Article content too short or missing for %s (%s chars)", article_url, len(content) if content else 0)
                 return None
             
-            print(f"    ✅ Article content extracted successfully")
             return {
                 "title": title,
                 "content": content,
@@ -723,103 +1162,51 @@ class AgnoService:
             }
             
         except Exception as e:
-            print(f"    💥 Failed to scrape article content from {article_url}: {str(e)}")
             logger.error(f"Failed to scrape article content from {article_url}: {str(e)}")
             return None
 
-    def _validate_news_link(self, title: str, full_url: str, href: str) -> bool:
+    def _parse_article_sync(self, page: bytes, encoding: Optional[str]) -> Tuple[str, str, datetime, str]:
+        """Extract title, content, publish date and author from a fetched article page"""
+        import lxml.html
+        
+        if encoding is None:
+            # No charset header: sniff it the way BeautifulSoup would (meta tag, then guessing)
+            from bs4.dammit import UnicodeDammit
+            encoding = UnicodeDammit(page, is_html=True).original_encoding
+        tree = lxml.html.document_fromstring(page, parser=lxml.html.HTMLParser(encoding=encoding))
+        # Content extraction drops boilerplate from the tree, so date and author come after it
+        return (
+            self._extract_title(tree),
+            self._extract_content(tree),
+            self._extract_date(tree),
+            self._extract_author(tree)
+        )
+
+    def _validate_news_link(self, title: str, full_url: str, href: str, title_matches: Dict[str, str]) -> bool:
         """
         Comprehensive validation to check if a link is actually a news article
         Returns True if it's a valid news link, False otherwise
+        
+        title_matches are the LINK_TITLE_AUTOMATON buckets found in the title.
         """
         if not title or not full_url:
-            print(f"      ❌ Skipped: Missing title or URL")
+            logger.debug("Skipped link: missing title or URL")
             return False
         
-        title_lower = title.lower()
-        url_lower = full_url.lower()
+        url_matches = _match_buckets(LINK_URL_AUTOMATON, full_url.lower())
         
         # 1. Check for obvious non-news patterns in title
-        non_news_title_patterns = [
-            # Navigation and UI elements
-            'home', 'about', 'contact', 'login', 'register', 'sign up', 'sign in',
-            'search', 'menu', 'navigation', 'footer', 'header', 'sidebar',
-            'read more', 'read original article', 'click here', 'learn more',
-            'subscribe', 'newsletter', 'advertisement', 'advertise',
-            
-            # Social media and external links
-            'facebook', 'twitter', 'linkedin', 'youtube', 'instagram', 'whatsapp',
-            'telegram', 'tiktok', 'snapchat', 'pinterest',
-            
-            # Contact and company info
-            'house-', 'road-', 'floor', 'dhaka', 'bangladesh',
-            'info@', '@', 'phone', 'tel:', 'fax:', 'email:',
-            'copyright', '©', 'all rights reserved', 'privacy',
-            'terms', 'contact us', 'about us', 'careers', 'jobs',
-            
-            # Generic actions
-            'download', 'upload', 'share', 'print', 'bookmark', 'favorite',
-            'like', 'comment', 'reply', 'follow', 'unfollow',
-            
-            # File types and media
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-            '.jpg', '.jpeg', '.png', '.gif', '.mp4', '.mp3', '.avi',
-            
-            # Common website elements
-            'cookie', 'policy', 'disclaimer', 'sitemap', 'rss', 'feed',
-            'archive', 'category', 'tag', 'author', 'date', 'time'
-        ]
-        
-        for pattern in non_news_title_patterns:
-            if pattern in title_lower:
-                print(f"      ❌ Skipped: Non-news pattern '{pattern}' in title")
-                return False
+        if "non_news" in title_matches:
+            logger.debug("Skipped %s: non-news pattern %r in title", full_url, title_matches["non_news"])
+            return False
         
         # 2. Check URL patterns that indicate non-news content
-        non_news_url_patterns = [
-            '/login', '/register', '/signup', '/signin', '/account',
-            '/cart', '/checkout', '/payment', '/billing',
-            '/admin', '/dashboard', '/panel', '/control',
-            '/api/', '/ajax/', '/json/', '/xml/',
-            '/assets/', '/css/', '/js/', '/images/', '/uploads/',
-            '/download/', '/upload/', '/media/',
-            '/search', '/filter', '/sort', '/page/',
-            '/tag/', '/category/', '/author/', '/date/',
-            '/rss', '/feed', '/sitemap', '/robots.txt'
-        ]
-        
-        for pattern in non_news_url_patterns:
-            if pattern in url_lower:
-                print(f"      ❌ Skipped: Non-news URL pattern '{pattern}'")
-                return False
+        if "non_news" in url_matches:
+            logger.debug("Skipped %s: non-news URL pattern %r", full_url, url_matches["non_news"])
+            return False
         
         # 3. Check for news-like patterns in title
-        news_patterns = [
-            # Action words
-            'announces', 'launches', 'reports', 'reveals', 'introduces',
-            'celebrates', 'partners', 'expands', 'invests', 'acquires',
-            'appoints', 'awards', 'recognizes', 'develops', 'innovates',
-            'challenges', 'opportunities', 'growth', 'development',
-            'launches', 'releases', 'unveils', 'discloses', 'confirms',
-            'denies', 'responds', 'comments', 'states', 'declares',
-            
-            # Industry and business terms
-            'industry', 'market', 'trade', 'export', 'import',
-            'technology', 'innovation', 'sustainability', 'compliance',
-            'manufacturing', 'production', 'supply chain', 'logistics',
-            'investment', 'funding', 'financing', 'revenue', 'profit',
-            'partnership', 'collaboration', 'agreement', 'contract',
-            
-            # Time-based indicators
-            'today', 'yesterday', 'this week', 'this month', 'this year',
-            'latest', 'recent', 'new', 'updated', 'breaking',
-            
-            # Event indicators
-            'event', 'conference', 'summit', 'meeting', 'workshop',
-            'exhibition', 'fair', 'show', 'presentation', 'seminar'
-        ]
-        
-        has_news_content = any(pattern in title_lower for pattern in news_patterns)
+        has_news_content = "news" in title_matches
         
         # 4. Check title structure and formatting
         looks_like_headline = (
@@ -832,28 +1219,20 @@ class AgnoService:
         )
         
         # 5. Check for proper URL structure (should contain article/news identifiers)
-        has_news_url_structure = any(pattern in url_lower for pattern in [
-            '/article/', '/news/', '/story/', '/post/', '/blog/',
-            '/202', '/2024', '/2025',  # Year indicators
-            '/jan/', '/feb/', '/mar/', '/apr/', '/may/', '/jun/',
-            '/jul/', '/aug/', '/sep/', '/oct/', '/nov/', '/dec/'
-        ])
+        has_news_url_structure = "news_structure" in url_matches
         
         # 6. Final validation
         is_valid = (
             (has_news_content or looks_like_headline) and
             has_news_url_structure and
-            not any(char.isdigit() for char in title[:5])  # Title shouldn't start with numbers
+            not TITLE_LEADING_DIGIT_RE.match(title)  # Title shouldn't start with numbers
         )
         
-        if is_valid:
-            print(f"      ✅ Valid news link: {title[:50]}...")
-        else:
-            print(f"      ❌ Skipped: Doesn't meet news link criteria")
-            if not has_news_content and not looks_like_headline:
-                print(f"         - No news content or headline structure")
-            if not has_news_url_structure:
-                print(f"         - No news URL structure")
+        if not is_valid:
+            logger.debug(
+                "Skipped %s: not a news link (news content or headline: %s, news URL structure: %s)",
+                full_url, has_news_content or looks_like_headline, has_news_url_structure
+            )
         
         return is_valid
 
@@ -862,93 +1241,50 @@ class AgnoService:
         if not text:
             return False
         
-        rmg_keywords = [
-            'rmg', 'textile', 'garment', 'apparel', 'clothing', 'fashion',
-            'manufacturing', 'export', 'cotton', 'fabric', 'factory',
-            'bangladesh', 'bgmea', 'bkmea', 'trade', 'industry'
-        ]
-        
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in rmg_keywords)
+        # Stops at the first keyword found
+        return next(RMG_AUTOMATON.iter(text.lower()), None) is not None
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, tree: HtmlElement) -> str:
         """Extract article title from HTML"""
-        title_selectors = [
-            'h1',
-            '.article-title',
-            '.post-title',
-            '.entry-title',
-            '.headline',
-            'title'
-        ]
-        
-        for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element:
-                title = element.get_text(strip=True)
+        for xpath in ARTICLE_TITLE_XPATHS:
+            elements = xpath(tree)
+            if elements:
+                title = _element_text(elements[0])
                 if title and len(title) > 10:
                     return title
         
         return ""
 
-    def _extract_content(self, soup: BeautifulSoup) -> str:
+    def _extract_content(self, tree: HtmlElement) -> str:
         """Extract article content from HTML"""
         # Remove unwanted elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement']):
-            element.decompose()
-        
-        content_selectors = [
-            '.article-content',
-            '.post-content',
-            '.entry-content',
-            '.content',
-            'article',
-            '.article-body',
-            '.post-body',
-            '.story-content'
-        ]
+        for element in ARTICLE_BOILERPLATE_XPATH(tree):
+            element.drop_tree()
         
-        for selector in content_selectors:
-            element = soup.select_one(selector)
-            if element:
-                # Get all paragraphs
-                paragraphs = element.find_all(['p', 'div'])
-                content_parts = []
-                
-                for p in paragraphs:
-                    text = p.get_text(strip=True)
-                    if text and len(text) > 20:  # Filter out short text
-                        content_parts.append(text)
+        for xpath in ARTICLE_CONTENT_XPATHS:
+            elements = xpath(tree)
+            if elements:
+                # Get all paragraphs, filtering out short text
+                content_parts = [
+                    text for block in CONTENT_BLOCKS_XPATH(elements[0])
+                    if len(text := _element_text(block)) > 20
+                ]
                 
                 if content_parts:
                     return '\n\n'.join(content_parts)
         
         # Fallback: get all paragraphs
-        paragraphs = soup.find_all('p')
-        content_parts = []
-        
-        for p in paragraphs:
-            text = p.get_text(strip=True)
-            if text and len(text) > 20:
-                content_parts.append(text)
-        
-        return '\n\n'.join(content_parts)
+        return '\n\n'.join([
+            text for p in PARAGRAPHS_XPATH(tree)
+            if len(text := _element_text(p)) > 20
+        ])
 
-    def _extract_date(self, soup: BeautifulSoup) -> datetime:
+    def _extract_date(self, tree: HtmlElement) -> datetime:
         """Extract publication date from HTML"""
-        date_selectors = [
-            '.published-date',
-            '.post-date',
-            '.article-date',
-            '.date',
-            'time',
-            '.timestamp'
-        ]
-        
-        for selector in date_selectors:
-            element = soup.select_one(selector)
-            if element:
-                date_text = element.get_text(strip=True)
+        for xpath in ARTICLE_DATE_XPATHS:
+            elements = xpath(tree)
+            if elements:
+                date_text = _element_text(elements[0])
                 # Try to parse various date formats
                 try:
                     # Add more date parsing logic here if needed
@@ -958,20 +1294,12 @@ class AgnoService:
         
         return datetime.now()
 
-    def _extract_author(self, soup: BeautifulSoup) -> str:
+    def _extract_author(self, tree: HtmlElement) -> str:
         """Extract author from HTML"""
-        author_selectors = [
-            '.author',
-            '.post-author',
-            '.article-author',
-            '.byline',
-            '.writer'
-        ]
-        
-        for selector in author_selectors:
-            element = soup.select_one(selector)
-            if element:
-                author = element.get_text(strip=True)
+        for xpath in ARTICLE_AUTHOR_XPATHS:
+            elements = xpath(tree)
+            if elements:
+                author = _element_text(elements[0])
                 if author and len(author) > 2:
                     return author
         
@@ -979,33 +1307,15 @@ class AgnoService:
 
     async def _clean_content_with_ai(self, content: str, title: str) -> str:
         """Use AI to clean content only (no summary generation)"""
-        print(f"      🤖 Starting AI content cleaning...")
         try:
-            prompt = f"""
-            Please clean this RMG industry news article content:
-            
-            Title: {title}
-            Raw Content: {content[:3000]}  # Limit to avoid token limits
-            
-            Please return ONLY the cleaned article content (no JSON, no title, no metadata) in this exact JSON format:
-            {{
-                "cleaned_content": "Pure article content with proper formatting, no title or metadata"
-            }}
-            
-            Important:
-            - Return ONLY the article content in cleaned_content (no title, no JSON wrapper, no metadata)
-            - Make the content readable and well-formatted
-            - Remove any HTML artifacts or formatting issues
-            - Keep all important information and details
-            - Do NOT generate any summary, just clean the content
-            """
+            prompt = f"{_CLEAN_PROMPT_PREFIX}\n\n---\nTitle: {title}\nRaw Content: {content[:CLEAN_CONTENT_CHARS]}"
             
             payload = {
                 "model": "deepseek-chat",
                 "messages": [
                     {
                         "role": "system",
-                        "content": "You are an expert content editor specializing in RMG industry news. Clean article content only, no summaries."
+                        "content": _CLEAN_SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -1016,41 +1326,31 @@ class AgnoService:
                 "max_tokens": 2500
             }
             
-            print(f"      📡 Making AI API request...")
-            response = requests.post(
-                self.deepseek_url,
-                json=payload,
-                headers=self.headers,
-                timeout=30
-            )
+            response = await self._post_deepseek(payload)
             
             if response.status_code == 200:
-                print(f"      ✅ AI API request successful")
-                result = response.json()
+                result = orjson.loads(response.content)
                 ai_response = result["choices"][0]["message"]["content"]
                 
                 try:
-                    print(f"      🔍 Parsing AI response...")
-                    enhanced_data = json.loads(ai_response)
+                    enhanced_data = orjson.loads(ai_response)
                     cleaned_content = enhanced_data.get("cleaned_content", content)
                     
                     # Ensure content is clean (no JSON artifacts)
                     if cleaned_content.startswith('{') or cleaned_content.startswith('"'):
                         # If AI returned JSON instead of clean content, use original
-                        print(f"      ⚠️  AI returned JSON artifacts, using original content")
+                        logger.debug("AI returned JSON artifacts, using original content")
                         cleaned_content = content
                     
-                    print(f"      ✅ AI content cleaning completed")
                     return cleaned_content
-                except json.JSONDecodeError:
-                    print(f"      ⚠️  Failed to parse AI JSON response, using original content")
+                except orjson.JSONDecodeError:
+                    logger.warning("Failed to parse AI cleaning response, using original content")
                     return content
             else:
-                print(f"      ❌ AI API request failed: {response.status_code}")
+                logger.warning("AI cleaning request failed: %s", response.status_code)
                 return content
                 
         except Exception as e:
-            print(f"      💥 AI content cleaning failed: {str(e)}")
             logger.error(f"AI content cleaning failed: {str(e)}")
             return content
 
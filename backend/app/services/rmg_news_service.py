@@ -1,11 +1,26 @@
 from datetime import datetime
-from typing import List, Dict
-from sqlalchemy.orm import Session
+from typing import List, Dict, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..models import NewsArticle
-from ..database import get_db
+from ..database import AsyncSessionLocal
 import asyncio
+import logging
 from .agno_service import agno_service
 
+logger = logging.getLogger(__name__)
+
+SENTIMENT_LABELS = ("positive", "negative", "neutral")
+# Deepseek requests spent on one article before it is left unlabelled for good
+SENTIMENT_MAX_ATTEMPTS = 3
+
+# Columns written by the PostgreSQL COPY path in store_articles_batch
+COPY_COLUMNS = (
+    "title", "content", "summary", "url", "source", "source_url", "author",
+    "published_at", "created_at", "updated_at", "is_processed"
+)
+
 class RMGNewsService:
     """Service to fetch and store RMG news from multiple sources"""
     
@@ -47,39 +62,87 @@ class RMGNewsService:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
-    async def fetch_all_sources(self, db: Session, articles_per_source: int = 15) -> Dict[str, int]:
+    async def fetch_all_sources(self, db: AsyncSession, articles_per_source: int = 15) -> Dict[str, int]:
         """Fetch news from all sources and store immediately"""
-        results = {}
-        
-        # Fetch from all sources sequentially (to avoid database session conflicts)
-        for source_id, source_info in self.sources.items():
+        # Sources are scraped concurrently, each with its own database session
+        async def fetch_source(source_id: str, source_info: Dict) -> Tuple[str, int]:
             try:
                 print(f"Fetching from {source_info['name']}...")
-                articles = await self.fetch_from_source(source_id, source_info, articles_per_source, db)
-                results[source_id] = len(articles)
+                async with AsyncSessionLocal() as source_db:
+                    articles = await self.fetch_from_source(source_id, source_info, articles_per_source, source_db)
                 print(f"Fetched {len(articles)} articles from {source_info['name']}")
+                return source_id, len(articles)
             except Exception as e:
                 print(f"Error fetching from {source_info['name']}: {str(e)}")
-                results[source_id] = 0
+                return source_id, 0
+        
+        results = dict(await asyncio.gather(
+            *(fetch_source(source_id, source_info) for source_id, source_info in self.sources.items())
+        ))
+        
+        # Label the new articles once so insights can aggregate them in SQL
+        try:
+            labelled = await self.classify_pending_sentiment(db)
+            logger.info("Labelled sentiment for %s articles", labelled)
+        except Exception:
+            logger.exception("Error classifying sentiment")
+            await db.rollback()
         
         return results
 
-    async def fetch_from_source(self, source_id: str, source_info: Dict, max_articles: int, db: Session) -> List[Dict]:
+    async def classify_pending_sentiment(self, db: AsyncSession, limit: int = 100) -> int:
+        """Store a Deepseek sentiment label on articles that do not have one yet"""
+        # Without a key every result would be a fallback, so don't spend attempts
+        if not agno_service.deepseek_api_key:
+            return 0
+        
+        result = await db.execute(
+            select(NewsArticle)
+            .where(
+                NewsArticle.sentiment_label.is_(None),
+                NewsArticle.sentiment_attempts < SENTIMENT_MAX_ATTEMPTS
+            )
+            .order_by(NewsArticle.published_at.desc())
+            .limit(limit)
+        )
+        articles = result.scalars().all()
+        
+        # The analyzer splits these into concurrent batched requests
+        analyses = await agno_service.analyze_articles_batch(
+            [(article.content or '', article.title) for article in articles]
+        )
+        labelled = 0
+        for article, analysis in zip(articles, analyses):
+            article.sentiment_attempts += 1
+            # Leave fallback results unlabelled so a later run asks Deepseek again,
+            # up to SENTIMENT_MAX_ATTEMPTS times
+            if analysis.get('method') != 'deepseek':
+                continue
+            label = str(analysis.get('sentiment', {}).get('label', 'neutral')).lower()
+            article.sentiment_label = label if label in SENTIMENT_LABELS else 'neutral'
+            labelled += 1
+        
+        await db.commit()
+        return labelled
+
+    async def fetch_from_source(self, source_id: str, source_info: Dict, max_articles: int, db: AsyncSession) -> List[Dict]:
         """Fetch articles from a specific source using Agno and store immediately"""
         try:
             print(f"Using Agno to scrape {source_info['name']}...")
             
-            # Create callback function for immediate storage
-            async def store_callback(article: Dict, db_session: Session) -> bool:
+            pending = []
+            
+            # Collect scraped articles so they can be inserted in one batch
+            async def store_callback(article: Dict, db_session: AsyncSession) -> bool:
                 # Add source information to article
                 article['source_id'] = source_id
                 article['source_info'] = source_info
                 article['author'] = article.get('author', source_info['name'])
                 
-                # Store the article immediately
-                return await self.store_single_article(article, db_session)
+                pending.append(article)
+                return True
             
-            # Use Agno to scrape the website with immediate storage
+            # Use Agno to scrape the website; the callback also enables its duplicate check
             articles = await agno_service.scrape_news_website(
                 source_info['url'], 
                 max_articles,
@@ -88,6 +151,7 @@ class RMGNewsService:
             )
             
             print(f"Agno scraped {len(articles)} articles from {source_info['name']}")
+            await self.store_articles_batch(db, pending)
             return articles
             
         except Exception as e:
@@ -96,83 +160,97 @@ class RMGNewsService:
 
 
 
-    async def store_single_article(self, article_data: Dict, db: Session) -> bool:
-        """Store a single article in database immediately (duplicate check already done)"""
-        try:
-            # Create new article (duplicate check was already done in agno_service)
-            article = NewsArticle(
-                title=article_data['title'],
-                content=article_data['content'],
-                summary=article_data['content'][:200] + "..." if len(article_data['content']) > 200 else article_data['content'],
-                url=article_data['url'],
-                source=article_data['source_id'],
-                source_url=article_data['source_info']['url'],
-                author=article_data.get('author', ''),
-                published_at=article_data['published_at'],
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            )
-            
-            # Store immediately
-            db.add(article)
-            db.commit()
-            print(f"  💾 Successfully stored article: {article_data['title'][:50]}...")
-            return True
-            
-        except Exception as e:
-            print(f"  ❌ Error storing article: {str(e)}")
-            db.rollback()
-            return False
+    def _article_values(self, article_data: Dict, now: Optional[datetime] = None) -> Dict:
+        """Column values for a scraped article, timestamped now unless a batch time is given"""
+        content = article_data['content']
+        # The scraper already trims the summary; only build it for articles from elsewhere
+        summary = article_data.get('summary')
+        if summary is None:
+            summary = content[:200] + "..." if len(content) > 200 else content
+        now = now or datetime.now()
+        return {
+            "title": article_data['title'],
+            "content": content,
+            "summary": summary,
+            "url": article_data['url'],
+            "source": article_data['source_id'],
+            "source_url": article_data['source_info']['url'],
+            "author": article_data.get('author', ''),
+            "published_at": article_data['published_at'],
+            "created_at": now,
+            "updated_at": now,
+            "is_processed": False
+        }
 
-    async def store_articles_batch(self, db: Session, articles: List[Dict]) -> int:
-        """Store articles in database using batch operations (legacy method)"""
-        stored_count = 0
-        new_articles = []
-        
-        # Get all existing URLs in one query
-        urls = [article['url'] for article in articles]
-        existing_urls = set()
-        if urls:
-            existing = db.query(NewsArticle.url).filter(NewsArticle.url.in_(urls)).all()
-            existing_urls = {row[0] for row in existing}
-        
-        # Prepare new articles
+    async def store_articles_batch(self, db: AsyncSession, articles: List[Dict]) -> int:
+        """Store articles in database using batch operations, skipping known URLs"""
+        rows = []
+        # One timestamp for the whole batch
+        now = datetime.now()
         for article_data in articles:
             try:
-                if article_data['url'] not in existing_urls:
-                    # Create new article
-                    article = NewsArticle(
-                        title=article_data['title'],
-                        content=article_data['content'],
-                        summary=article_data['content'][:200] + "..." if len(article_data['content']) > 200 else article_data['content'],
-                        url=article_data['url'],
-                        source=article_data['source_id'],
-                        source_url=article_data['source_info']['url'],
-                        author=article_data.get('author', ''),
-                        published_at=article_data['published_at'],
-                        created_at=datetime.now(),
-                        updated_at=datetime.now()
-                    )
-                    
-                    new_articles.append(article)
-                    stored_count += 1
-                
+                rows.append(self._article_values(article_data, now))
             except Exception as e:
                 print(f"Error preparing article: {str(e)}")
-                continue
         
-        # Batch insert all new articles
-        if new_articles:
-            try:
+        if not rows:
+            return 0
+        
+        try:
+            dialect = db.bind.dialect.name
+            if dialect == "postgresql":
+                stored_count = await self._copy_articles(db, rows)
+            elif dialect == "sqlite":
+                # INSERT OR IGNORE semantics: the unique url index drops known articles
+                result = await db.execute(
+                    sqlite_insert(NewsArticle).values(rows).on_conflict_do_nothing(index_elements=["url"])
+                )
+                stored_count = result.rowcount
+            else:
+                existing = await db.execute(
+                    select(NewsArticle.url).where(NewsArticle.url.in_([row['url'] for row in rows]))
+                )
+                existing_urls = set(existing.scalars())
+                new_articles = [NewsArticle(**row) for row in rows if row['url'] not in existing_urls]
                 db.add_all(new_articles)
-                db.commit()
-                print(f"Batch stored {stored_count} new articles")
-            except Exception as e:
-                print(f"Error committing to database: {str(e)}")
-                db.rollback()
-                stored_count = 0
+                stored_count = len(new_articles)
+            await db.commit()
+            print(f"Batch stored {stored_count} new articles")
+            return stored_count
+        except Exception as e:
+            print(f"Error committing to database: {str(e)}")
+            await db.rollback()
+            return 0
+
+    async def _copy_articles(self, db: AsyncSession, rows: List[Dict]) -> int:
+        """
+        Bulk insert rows over PostgreSQL's COPY protocol
         
-        return stored_count
+        Rows are copied into a temporary staging table first so that URLs
+        already in news_articles can be skipped with ON CONFLICT.
+        """
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        conn = raw_connection.driver_connection
+        columns = ", ".join(COPY_COLUMNS)
+        
+        async with conn.transaction():
+            await conn.execute(
+                f"CREATE TEMP TABLE news_articles_incoming ON COMMIT DROP AS "
+                f"SELECT {columns} FROM news_articles WITH NO DATA"
+            )
+            await conn.copy_records_to_table(
+                "news_articles_incoming",
+                records=[tuple(row[column] for column in COPY_COLUMNS) for row in rows],
+                columns=COPY_COLUMNS
+            )
+            status = await conn.execute(
+                f"INSERT INTO news_articles ({columns}) "
+                f"SELECT DISTINCT ON (url) {columns} FROM news_articles_incoming "
+                f"ON CONFLICT (url) DO NOTHING"
+            )
+        # Status is "INSERT 0 <rows>"
+        return int(status.split()[-1])
 
     def get_sources(self) -> Dict[str, Dict]:
         """Get available sources"""
@@ -0,0 +1,131 @@
+import re
+from typing import Dict, List
+
+# Numba and NumPy are optional; without them trending topics come from the LLM
+try:
+    import numpy as np
+    from numba import njit
+    SCORER_AVAILABLE = True
+except ImportError:
+    SCORER_AVAILABLE = False
+
+TOKEN_RE = re.compile(r"[a-z][a-z'-]{2,}")
+
+STOP_WORDS = frozenset("""
+    about above after again against also among and another any are around because been before
+    being below between both but can could did does doing down during each few for from further
+    had has have having her here hers him his how into its itself just last many may more most
+    much must new not now off once only other our ours out over own per said same says she should
+    since some such than that the their theirs them then there these they this those through
+    under until very was were what when where which while who whom why will with within without
+    would year years you your according told week month today yesterday percent
+""".split())
+
+# Topic category by keyword stem; first match wins, anything else is "General"
+CATEGORY_KEYWORDS = (
+    ("RMG", ("garment", "apparel", "rmg", "clothing", "knit", "woven", "bgmea", "bkmea")),
+    ("Manufacturing", ("factory", "factories", "textile", "fabric", "cotton", "yarn", "production", "manufactur")),
+    ("Trade", ("export", "import", "tariff", "trade", "buyer", "order", "market", "shipment")),
+    ("Labour", ("worker", "wage", "labour", "labor", "union", "safety")),
+    ("Sustainability", ("green", "sustainab", "recycl", "carbon", "energy", "environment")),
+    ("Fashion", ("fashion", "brand", "retail", "design")),
+)
+
+if SCORER_AVAILABLE:
+    @njit(cache=True)
+    def score_terms(counts, baseline):
+        """
+        Score terms by how far their recent frequency exceeds the baseline
+
+        Args:
+            counts: int32[docs, terms] term counts for the recent articles
+            baseline: float32[terms] smoothed per-token rate of each term in the baseline window
+
+        Returns:
+            float32[terms] z-score of each term's recent count against its expected
+            count, weighted by the share of recent articles mentioning it
+        """
+        n_docs, n_terms = counts.shape
+        total = 0
+        for i in range(n_docs):
+            for j in range(n_terms):
+                total += counts[i, j]
+
+        min_df = 2 if n_docs > 1 else 1
+        scores = np.zeros(n_terms, dtype=np.float32)
+        for j in range(n_terms):
+            tf = 0
+            df = 0
+            for i in range(n_docs):
+                c = counts[i, j]
+                if c > 0:
+                    tf += c
+                    df += 1
+            if df < min_df:
+                continue
+            expected = baseline[j] * total
+            scores[j] = (tf - expected) / np.sqrt(expected + 1.0) * (df / n_docs)
+        return scores
+
+def _tokenize(text: str) -> List[str]:
+    """Lowercase unigrams and adjacent-word bigrams, without stop words"""
+    words = [w.strip("'-") for w in TOKEN_RE.findall(text.lower())]
+    words = [w for w in words if len(w) > 2 and w not in STOP_WORDS]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+def _categorize(term: str) -> str:
+    for category, stems in CATEGORY_KEYWORDS:
+        if any(stem in term for stem in stems):
+            return category
+    return "General"
+
+def rank_trending_terms(recent_texts: List[str], baseline_texts: List[str], top_k: int = 5) -> List[Dict]:
+    """
+    Rank the terms trending in recent articles relative to a baseline window
+
+    Args:
+        recent_texts: Texts of the articles in the trending window
+        baseline_texts: Texts of older articles used as the baseline
+        top_k: Number of topics to return
+
+    Returns:
+        List of topics with name, category and a 0-1 score, in the same shape
+        as AgnoService.identify_trending_topics
+    """
+    vocabulary: Dict[str, int] = {}
+    recent_tokens = [_tokenize(text) for text in recent_texts]
+    for tokens in recent_tokens:
+        for token in tokens:
+            vocabulary.setdefault(token, len(vocabulary))
+    if not vocabulary:
+        return []
+
+    counts = np.zeros((len(recent_tokens), len(vocabulary)), dtype=np.int32)
+    for i, tokens in enumerate(recent_tokens):
+        for token in tokens:
+            counts[i, vocabulary[token]] += 1
+
+    # Add-one smoothed baseline rates; terms unseen there still get a small expectation
+    baseline_counts = np.ones(len(vocabulary), dtype=np.float32)
+    for text in baseline_texts:
+        for token in _tokenize(text):
+            index = vocabulary.get(token)
+            if index is not None:
+                baseline_counts[index] += 1
+    baseline = baseline_counts / baseline_counts.sum()
+
+    scores = score_terms(counts, baseline)
+    terms = list(vocabulary)
+    top = [int(j) for j in np.argsort(-scores)[:top_k] if scores[j] > 0]
+    if not top:
+        return []
+
+    best = float(scores[top[0]])
+    return [
+        {
+            "name": terms[j].title(),
+            "category": _categorize(terms[j]),
+            "score": round(float(scores[j]) / best, 2)
+        }
+        for j in top
+    ]
@@ -3,17 +3,19 @@
 Script to delete rows 47-69 from the NewsArticle database
 """
 
-from app.database import get_db
+import asyncio
+from app.database import AsyncSessionLocal
 from app.models import NewsArticle
-from sqlalchemy.orm import Session
+from sqlalchemy import select, delete
 
-def delete_articles_1_and_2():
+async def delete_articles_1_and_2():
     """Delete rows 1 and 2 (indices 0 and 1)"""
-    db = next(get_db())
+    db = AsyncSessionLocal()
     
     try:
         # Get articles from row 1 to 2 (offset 0, limit 2)
-        articles = db.query(NewsArticle).offset(0).limit(2).all()
+        result = await db.execute(select(NewsArticle).offset(0).limit(2))
+        articles = result.scalars().all()
         
         if not articles:
             print("No articles found in rows 1-2.")
@@ -33,21 +35,22 @@ def delete_articles_1_and_2():
         confirm = input("Delete these articles? (y/N): ")
         
         if confirm.lower() == 'y':
-            # Delete each article
-            for article in articles:
-                db.delete(article)
+            # Delete them all in one statement
+            await db.execute(
+                delete(NewsArticle).where(NewsArticle.id.in_([article.id for article in articles]))
+            )
             
             # Commit the changes
-            db.commit()
+            await db.commit()
             print(f"✅ Successfully deleted {len(articles)} articles!")
         else:
             print("❌ Deletion cancelled.")
             
     except Exception as e:
         print(f"❌ Error: {e}")
-        db.rollback()
+        await db.rollback()
     finally:
-        db.close()
+        await db.close()
 
 if __name__ == "__main__":
-    delete_articles_1_and_2() 
\ No newline at end of file
+    asyncio.run(delete_articles_1_and_2()) 
\ No newline at end of file
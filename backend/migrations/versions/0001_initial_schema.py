@@ -0,0 +1,51 @@
+"""Initial news_articles schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00
+
+Matches tables created by Base.metadata.create_all before migrations were
+introduced; stamp existing databases with `alembic stamp 0001`.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "news_articles",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=500), nullable=False),
+        sa.Column("content", sa.Text(), nullable=True),
+        sa.Column("summary", sa.Text(), nullable=True),
+        sa.Column("url", sa.String(length=1000), nullable=False),
+        sa.Column("source", sa.String(length=200), nullable=False),
+        sa.Column("source_url", sa.String(length=200), nullable=False),
+        sa.Column("author", sa.String(length=200), nullable=True),
+        sa.Column("published_at", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("ai_summary", sa.Text(), nullable=True),
+        sa.Column("market_impact", sa.String(length=50), nullable=True),
+        sa.Column("confidence_score", sa.Float(), nullable=True),
+        sa.Column("is_processed", sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("url"),
+    )
+    op.create_index("ix_news_articles_id", "news_articles", ["id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_news_articles_id", table_name="news_articles")
+    op.drop_table("news_articles")
@@ -0,0 +1,40 @@
+"""Add sentiment_label and the listing/search indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Copy of app.models.SEARCH_DOCUMENT as of this revision, frozen so later model
+# edits never change a shipped migration
+SEARCH_DOCUMENT = "to_tsvector('english', title || ' ' || coalesce(content, '') || ' ' || coalesce(summary, ''))"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("news_articles", sa.Column("sentiment_label", sa.String(length=16), nullable=True))
+    op.create_index("ix_news_articles_sentiment_label", "news_articles", ["sentiment_label"])
+    op.create_index("ix_news_source_pub", "news_articles", ["source", sa.text("published_at DESC"), "id"])
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_index("ix_news_search", "news_articles", [sa.text(SEARCH_DOCUMENT)], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_news_search", table_name="news_articles")
+    op.drop_index("ix_news_source_pub", table_name="news_articles")
+    op.drop_index("ix_news_articles_sentiment_label", table_name="news_articles")
+    op.drop_column("news_articles", "sentiment_label")
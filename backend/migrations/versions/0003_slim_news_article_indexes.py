@@ -0,0 +1,48 @@
+"""Drop the redundant id index, add ix_news_published_at, widen source_url
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The primary key is already indexed
+    op.drop_index("ix_news_articles_id", table_name="news_articles")
+    op.create_index("ix_news_published_at", "news_articles", [sa.text("published_at DESC")])
+    # SQLite ignores VARCHAR lengths, so skip rebuilding the table there
+    if op.get_bind().dialect.name != "sqlite":
+        op.alter_column(
+            "news_articles",
+            "source_url",
+            existing_type=sa.String(length=200),
+            type_=sa.String(length=255),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        op.alter_column(
+            "news_articles",
+            "source_url",
+            existing_type=sa.String(length=255),
+            type_=sa.String(length=200),
+            existing_nullable=False,
+        )
+    op.drop_index("ix_news_published_at", table_name="news_articles")
+    op.create_index("ix_news_articles_id", "news_articles", ["id"])
@@ -0,0 +1,31 @@
+"""Count Deepseek sentiment labelling attempts per article
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "news_articles",
+        sa.Column("sentiment_attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("news_articles", "sentiment_attempts")